@@ -15,33 +15,25 @@ def get_long_description():
         return f.read()
 
 
-def get_version():
-    current_dir = os.path.abspath(os.path.dirname(__file__))
-    version_file = os.path.join(current_dir, "vyvodata", "__init__.py")
-    with open(version_file, encoding="utf-8") as f:
-        return re.search(r'^__version__ = [\'"]([^\'"]*)[\'"]', f.read(), re.M).group(1)
+INIT_META_RE = re.compile(r'^__(version|author|license)__ = [\'"]([^\'"]*)[\'"]', re.M)
 
 
-def get_author():
+def get_init_meta():
     current_dir = os.path.abspath(os.path.dirname(__file__))
     init_file = os.path.join(current_dir, "vyvodata", "__init__.py")
     with open(init_file, encoding="utf-8") as f:
-        return re.search(r'^__author__ = [\'"]([^\'"]*)[\'"]', f.read(), re.M).group(1)
+        return dict(INIT_META_RE.findall(f.read()))
 
 
-def get_license():
-    current_dir = os.path.abspath(os.path.dirname(__file__))
-    init_file = os.path.join(current_dir, "vyvodata", "__init__.py")
-    with open(init_file, encoding="utf-8") as f:
-        return re.search(r'^__license__ = [\'"]([^\'"]*)[\'"]', f.read(), re.M).group(1)
+init_meta = get_init_meta()
 
 
 setuptools.setup(
     name="vyvodata",
-    version=get_version(),
-    author=get_author(),
+    version=init_meta["version"],
+    author=init_meta["author"],
     author_email="kadir.nar@hotmail.com",
-    license=get_license(),
+    license=init_meta["license"],
     description="VyvoData: Enhanced dataset management utilities for Hugging Face Hub.",
     long_description=get_long_description(),
     long_description_content_type="text/markdown",
@@ -0,0 +1,66 @@
+import json
+import os
+
+import numpy as np
+import soundfile as sf
+from datasets import Audio, Dataset
+
+from vyvodata.utils import huggingface
+
+
+def _path_dataset(paths):
+    dataset = Dataset.from_dict({"audio": [{"path": p, "bytes": None} for p in paths]})
+    return dataset.cast_column("audio", Audio(decode=False))
+
+
+def test_download_audio_files_skips_a_first_batch_of_failed_rows(tmp_path, monkeypatch):
+    source = str(tmp_path / "source.wav")
+    sf.write(source, np.zeros(160), 16000)
+    # The whole first map batch (64 rows) points to missing files
+    paths = [str(tmp_path / "missing.wav")] * 64 + [source] * 3
+    dataset = _path_dataset(paths)
+
+    class Builder:
+        info = type("Info", (), {"features": dataset.features})
+
+    monkeypatch.setattr(huggingface, "load_dataset", lambda *a, **k: dataset)
+    monkeypatch.setattr(huggingface, "load_dataset_builder", lambda *a, **k: Builder)
+
+    output_dir = str(tmp_path / "out")
+    files = huggingface.download_audio_files(
+        "user/dataset", output_dir=output_dir, num_proc=1, streaming=False
+    )
+
+    assert [os.path.basename(f) for f in files] == [
+        "audio_00064.wav",
+        "audio_00065.wav",
+        "audio_00066.wav",
+    ]
+    with open(os.path.join(output_dir, huggingface.MANIFEST_NAME)) as f:
+        assert not json.load(f).get("partial")
+
+
+def test_upload_to_hub_accepts_a_single_ignore_pattern(tmp_path, monkeypatch):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "a.txt").write_text("a")
+    (tmp_path / "README.md").write_text("readme")
+    commits = []
+
+    class Api:
+        def __init__(self, token=None):
+            pass
+
+        def preupload_lfs_files(self, repo_id, additions, repo_type):
+            pass
+
+        def create_commit(self, operations, **kwargs):
+            commits.append(operations)
+            return "url"
+
+    monkeypatch.setattr(huggingface, "HfApi", Api)
+
+    huggingface.upload_to_hub(
+        str(tmp_path), "user/repo", create_repo=False, ignore_patterns="*.md"
+    )
+
+    assert [op.path_in_repo for op in commits[0]] == ["data/a.txt"]
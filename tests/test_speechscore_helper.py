@@ -0,0 +1,20 @@
+import numpy as np
+
+from vyvodata.tools.speechscore.scores.helper import llr
+
+
+def test_llr_is_finite_on_silent_frames():
+    rng = np.random.default_rng(0)
+    clean = rng.standard_normal(19200)
+    degraded = clean + 0.1 * rng.standard_normal(19200)
+    # Leading silence, in the reference, the degraded signal or both
+    clean_silent, degraded_silent = clean.copy(), degraded.copy()
+    clean_silent[:3200] = 0.0
+    degraded_silent[:3200] = 0.0
+
+    for ref_wav, deg_wav in [
+        (clean_silent, degraded),
+        (clean, degraded_silent),
+        (clean_silent, degraded_silent),
+    ]:
+        assert np.isfinite(llr(ref_wav, deg_wav, 16000)).all()
@@ -1,11 +1,14 @@
-import json
 import os
 from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
+
 from vyvodata.tools.audiobox_aesthetics.infer import initialize_predictor
 
-# Import huggingface utils
-from vyvodata.utils.huggingface import download_audio_files
+# Import file and huggingface utils
+from vyvodata.utils.files import find_missing_paths
+from vyvodata.utils.files import save_json as save_json_file
+from vyvodata.utils.huggingface import iter_audio_files
 
 
 class AudioAestheticsPredictor:
@@ -26,22 +29,31 @@ class AudioAestheticsPredictor:
         """
         self.predictor = initialize_predictor(checkpoint_pth=checkpoint_pth)
 
-    def process_audio(self, audio_paths):
+    def process_audio(self, audio_paths, batch_size: int = 16):
         """
         Process audio files using the initialized predictor.
 
         Args:
             audio_paths (list): List of dictionaries containing paths to audio files.
                 Each dictionary should have a 'path' key with the file path as value.
+            batch_size (int): Number of files padded and run through the model together.
 
         Returns:
             The results from the predictor's forward method.
         """
-        output = self.predictor.forward(audio_paths)
+        output = []
+        for start in range(0, len(audio_paths), batch_size):
+            output.extend(
+                self.predictor.forward(audio_paths[start : start + batch_size])
+            )
         return output
 
     def __call__(
-        self, audio_path: Union[str, List[str]], output_dir: str = "./results", **kwargs
+        self,
+        audio_path: Union[str, List[str]],
+        output_dir: str = "./results",
+        batch_size: int = 16,
+        **kwargs,
     ) -> Dict[str, Any]:
         """
         Make the class callable to directly process audio files or HuggingFace datasets.
@@ -49,6 +61,7 @@ class AudioAestheticsPredictor:
         Args:
             audio_path: Either a single audio file path, list of audio file paths, or a HuggingFace dataset ID.
             output_dir: Directory to save results when processing datasets
+            batch_size: Number of audio files run through the model together
             **kwargs: Additional arguments for dataset processing (split, num_samples, etc.)
 
         Returns:
@@ -75,7 +88,10 @@ class AudioAestheticsPredictor:
             # This looks like a HF dataset ID (e.g., "OpenSpeechHub/2M-Belebele-Ja")
             print(f"Processing HuggingFace dataset: {audio_path}")
             return self.process_hf_dataset_simple(
-                dataset_name=audio_path, output_dir=output_dir, **kwargs
+                dataset_name=audio_path,
+                output_dir=output_dir,
+                batch_size=batch_size,
+                **kwargs,
             )
 
         # Handle audio file paths
@@ -87,13 +103,13 @@ class AudioAestheticsPredictor:
             formatted_paths = [{"path": audio_path}]
         else:
             # Format list of paths
-            for path in audio_path:
-                if not os.path.exists(path):
-                    raise FileNotFoundError(f"Audio file not found: {path}")
+            missing_paths = find_missing_paths(audio_path)
+            if missing_paths:
+                raise FileNotFoundError(f"Audio file not found: {missing_paths[0]}")
             formatted_paths = [{"path": path} for path in audio_path]
 
         # Process the audio and return results
-        result = self.process_audio(formatted_paths)
+        result = self.process_audio(formatted_paths, batch_size=batch_size)
 
         # If single file, convert any tensor values to Python types
         if isinstance(audio_path, str):
@@ -119,18 +135,27 @@ class AudioAestheticsPredictor:
         num_samples: Optional[int] = None,
         id_column: Optional[str] = None,
         save_json: bool = True,
+        batch_size: int = 16,
+        prefetch: int = 32,
     ) -> Dict[str, Any]:
         """
         Simplified function to process audio from a HuggingFace dataset and return aesthetics scores.
 
+        The dataset rows are streamed: each batch of `batch_size` audio files is scored
+        while up to `prefetch` more are downloaded in the background. The audio files are
+        saved once into the shared vyvodata cache (see
+        `vyvodata.utils.huggingface.audio_cache_dir`) and reused by later runs.
+
         Args:
             dataset_name: Name of the HuggingFace dataset
-            output_dir: Directory to save downloaded audio files and results
+            output_dir: Directory to save the results
             split: Dataset split to use
             audio_column: Name of the column containing audio data
             num_samples: Number of samples to process (None for all)
             id_column: Column to use for audio file IDs (None for default)
             save_json: Whether to save results to a JSON file
+            batch_size: Number of audio files run through the model together
+            prefetch: Number of audio files downloaded ahead of inference
 
         Returns:
             Dictionary with file-specific scores and average scores
@@ -141,23 +166,32 @@ class AudioAestheticsPredictor:
         )
         os.makedirs(dataset_output_dir, exist_ok=True)
 
-        # Download audio files from the dataset
-        audio_files = download_audio_files(
+        # Stream audio files from the dataset, or reuse the cached copy, and run
+        # inference on each batch while the next files download
+        audio_files = []
+        results = []
+        batch = []
+        for path in iter_audio_files(
             dataset_name=dataset_name,
-            output_dir=dataset_output_dir,
             split=split,
             audio_column=audio_column,
             num_samples=num_samples,
             id_column=id_column,
-        )
+            prefetch=prefetch,
+        ):
+            batch.append(path)
+            if len(batch) == batch_size:
+                results += self.process_audio([{"path": p} for p in batch], batch_size)
+                audio_files += batch
+                batch = []
+        if batch:
+            results += self.process_audio([{"path": p} for p in batch], batch_size)
+            audio_files += batch
 
         # Check if we got any audio files
         if not audio_files:
             return {}
 
-        # Run inference on all downloaded audio files
-        results = self.process_audio([{"path": path} for path in audio_files])
-
         # Format results to include both file paths and scores
         file_scores = {}
         avg_scores = {}
@@ -166,33 +200,27 @@ class AudioAestheticsPredictor:
             # Get metrics from the first result
             metrics = list(results[0].keys())
 
-            # Initialize averages
-            for metric in metrics:
-                avg_scores[metric] = 0
-
-            # Process each file's results
-            for i, path in enumerate(audio_files):
-                # Get filename without directory
-                filename = os.path.basename(path)
-
-                # Store scores for this file
-                file_scores[filename] = {}
-
-                # Process each metric
-                for metric in metrics:
-                    value = results[i].get(metric)
-                    if hasattr(value, "item"):
-                        value = float(value.item())
-                    if value is not None:
-                        # Round to 3 decimal places
-                        rounded_value = round(float(value), 3)
-                        file_scores[filename][metric] = rounded_value
-                        avg_scores[metric] += rounded_value
-
-            # Calculate final averages
-            if file_scores:
-                for metric in metrics:
-                    avg_scores[metric] = round(avg_scores[metric] / len(file_scores), 3)
+            # Stack the scores into a (files, metrics) matrix rounded to 3 decimal
+            # places, with NaN for missing values
+            scores = np.array(
+                [[result.get(metric) for metric in metrics] for result in results],
+                dtype=float,
+            ).round(3)
+            present = ~np.isnan(scores)
+
+            # Store scores for each file, by filename without directory
+            for path, row, row_present in zip(
+                audio_files, scores.tolist(), present.tolist()
+            ):
+                file_scores[os.path.basename(path)] = {
+                    metric: value
+                    for metric, value, is_present in zip(metrics, row, row_present)
+                    if is_present
+                }
+
+            # Calculate final averages, missing values counting as 0
+            averages = np.where(present, scores, 0).sum(axis=0) / len(file_scores)
+            avg_scores = dict(zip(metrics, averages.round(3).tolist()))
 
         # Prepare final output
         output = {"files": file_scores, "average": avg_scores}
@@ -200,7 +228,6 @@ class AudioAestheticsPredictor:
         # Save results as JSON
         if save_json and output["files"]:
             output_path = os.path.join(dataset_output_dir, "scores.json")
-            with open(output_path, "w") as f:
-                json.dump(output, f, indent=2)
+            save_json_file(output, output_path)
 
         return output
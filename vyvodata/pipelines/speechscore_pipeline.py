@@ -1,8 +1,12 @@
-import json
 import os
 from typing import Any, Dict, List, Optional, Union
 
+from vyvodata.tools.speechscore.scores.helper import compile_kernels
 from vyvodata.tools.speechscore.speechscore import speech_score
+from vyvodata.utils.files import save_json as save_json_file
+
+# Metrics built on the numba kernels in speechscore.scores.helper
+JIT_METRICS = {"SSNR", "LLR", "CSIG", "CBAK", "COVL"}
 
 
 class SpeechScorePredictor:
@@ -59,6 +63,10 @@ class SpeechScorePredictor:
 
         self.model = speech_score(metrics)
 
+        # Compile the numba kernels now rather than on the first scored file
+        if JIT_METRICS.intersection(metric.upper() for metric in metrics):
+            compile_kernels()
+
     def process_audio(
         self,
         test_path: str,
@@ -66,6 +74,8 @@ class SpeechScorePredictor:
         window: Optional[float] = None,
         score_rate: int = 16000,
         return_mean: bool = False,
+        batch_size: int = 1,
+        num_workers: int = 1,
     ):
         """
         Process audio files using the initialized SpeechScore model.
@@ -76,6 +86,8 @@ class SpeechScorePredictor:
             window: Window size in seconds. None for full audio processing.
             score_rate: Sampling rate for metric computation.
             return_mean: Whether to return mean scores for directory processing.
+            batch_size: Number of files scored together for directory processing.
+            num_workers: Number of worker processes for directory processing.
 
         Returns:
             Dictionary containing speech quality scores.
@@ -86,6 +98,8 @@ class SpeechScorePredictor:
             window=window,
             score_rate=score_rate,
             return_mean=return_mean,
+            batch_size=batch_size,
+            num_workers=num_workers,
         )
         return scores
 
@@ -98,6 +112,8 @@ class SpeechScorePredictor:
         return_mean: bool = False,
         output_dir: Optional[str] = None,
         save_json: bool = False,
+        batch_size: int = 1,
+        num_workers: int = 1,
         **kwargs,
     ) -> Dict[str, Any]:
         """
@@ -111,6 +127,10 @@ class SpeechScorePredictor:
             return_mean: Whether to return mean scores for directory processing.
             output_dir: Directory to save results (optional).
             save_json: Whether to save results to a JSON file.
+            batch_size: Number of files scored together for directory processing. Model-based
+                metrics (e.g. 'DISTILL_MOS') run each batch through a single forward pass.
+            num_workers: Number of worker processes scoring the files of a directory. The
+                CPU metrics run in the pool; 'DISTILL_MOS' and 'NISQA' stay in this process.
             **kwargs: Additional arguments for future extensions.
 
         Returns:
@@ -128,6 +148,12 @@ class SpeechScorePredictor:
             # Process multiple files from directories
             >>> results = predictor("noisy_dir/", reference_path="clean_dir/", return_mean=True)
 
+            # Score a directory 16 files at a time
+            >>> results = predictor("noisy_dir/", batch_size=16)
+
+            # Score a directory with 8 worker processes
+            >>> results = predictor("noisy_dir/", reference_path="clean_dir/", num_workers=8)
+
             # Process with custom metrics
             >>> predictor = SpeechScorePredictor(metrics=['PESQ', 'STOI', 'SISDR'])
             >>> result = predictor("test.wav", reference_path="clean.wav")
@@ -152,6 +178,8 @@ class SpeechScorePredictor:
                 window=window,
                 score_rate=score_rate,
                 return_mean=return_mean,
+                batch_size=batch_size,
+                num_workers=num_workers,
             )
 
         else:
@@ -167,8 +195,7 @@ class SpeechScorePredictor:
         if save_json and output_dir:
             os.makedirs(output_dir, exist_ok=True)
             output_path = os.path.join(output_dir, "speechscore_results.json")
-            with open(output_path, "w") as f:
-                json.dump(result, f, indent=2)
+            save_json_file(result, output_path)
             print(f"Results saved to: {output_path}")
 
         return result
@@ -188,9 +215,7 @@ class SpeechScorePredictor:
             for key, value in result.items():
                 if isinstance(value, dict):
                     cleaned[key] = self._clean_result(value)
-                elif hasattr(value, "item"):
-                    cleaned[key] = round(float(value.item()), 4)
-                elif isinstance(value, (int, float)):
+                elif hasattr(value, "item") or isinstance(value, (int, float)):
                     cleaned[key] = round(float(value), 4)
                 else:
                     cleaned[key] = value
@@ -4,6 +4,8 @@ class ScoreBasis:
         self.score_rate = None
         # is the score intrusive or non-intrusive ?
         self.intrusive = True  # require a reference
+        # can the score be computed in a worker process ?
+        self.parallel = True
         self.name = name
         self.model = None
         self.device = "cpu"
@@ -13,14 +15,16 @@ class ScoreBasis:
             f"In {self.name}, windowed_scoring is not yet implemented"
         )
 
-    def scoring(self, data, window=None, score_rate=None):
-        """calling the `windowed_scoring` function that should be specialised
-        depending on the score."""
+    def batched_windowed_scoring(self, audios_list, score_rate):
+        """scoring several inputs at once. Falls back to one `windowed_scoring`
+        call per input; scores backed by a model can override it to batch."""
+        return [self.windowed_scoring(audios, score_rate) for audios in audios_list]
+
+    def prepare_audios(self, data):
+        """resampling the loaded audios to the rate the score operates on."""
 
         # imports
-        # import soundfile as sf
         import resampy
-        from museval.metrics import Framing
 
         # checking rate
         audios = data["audio"].copy()
@@ -33,6 +37,16 @@ class ScoreBasis:
             for index, audio in enumerate(audios):
                 audio = resampy.resample(audio, data["rate"], score_rate, axis=0)
                 audios[index] = audio
+        return audios, score_rate
+
+    def scoring(self, data, window=None, score_rate=None):
+        """calling the `windowed_scoring` function that should be specialised
+        depending on the score."""
+
+        # imports
+        from museval.metrics import Framing
+
+        audios, score_rate = self.prepare_audios(data)
 
         if window is not None:
             framer = Framing(window * score_rate, window * score_rate, len(audios[0]))
@@ -45,3 +59,12 @@ class ScoreBasis:
         else:
             result = self.windowed_scoring(audios, score_rate)
         return result
+
+    def batched_scoring(self, data_list, window=None, score_rate=None):
+        """scoring a list of loaded inputs, going through
+        `batched_windowed_scoring` when all of them share the score rate."""
+        if window is not None or self.score_rate is None:
+            return [self.scoring(data, window, score_rate) for data in data_list]
+
+        audios_list = [self.prepare_audios(data)[0] for data in data_list]
+        return self.batched_windowed_scoring(audios_list, self.score_rate)
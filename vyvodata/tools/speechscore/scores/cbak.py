@@ -2,7 +2,12 @@ import numpy as np
 from pesq import pesq
 
 from vyvodata.tools.speechscore.basis import ScoreBasis
-from vyvodata.tools.speechscore.scores.helper import norm_mos, ssnr, wss
+from vyvodata.tools.speechscore.scores.helper import (
+    composite_measures,
+    ssnr,
+    trimmed_mean,
+    wss,
+)
 
 
 class CBAK(ScoreBasis):
@@ -21,19 +26,14 @@ def cal_cbak(target_wav, pred_wav, fs):
     alpha = 0.95
 
     # Compute WSS measure
-    wss_dist_vec = wss(target_wav, pred_wav, fs)
-    wss_dist_vec = sorted(wss_dist_vec, reverse=False)
-    wss_dist = np.mean(wss_dist_vec[: int(round(len(wss_dist_vec) * alpha))])
+    wss_dist = trimmed_mean(wss(target_wav, pred_wav, fs), alpha)
 
-    # Compute the SSNR
-    snr_mean, seg_snr_mean = ssnr(target_wav, pred_wav, fs)
+    # Compute the SSNR (ssnr rescales its inputs in place)
+    snr_mean, seg_snr_mean = ssnr(target_wav.copy(), pred_wav.copy(), fs)
     seg_snr = np.mean(seg_snr_mean)
 
     # Compute the PESQ
     pesq_raw = pesq(fs, target_wav, pred_wav, "wb")
 
     # cbak
-    cbak = 1.634 + 0.478 * pesq_raw - 0.007 * wss_dist + 0.063 * seg_snr
-    cbak = norm_mos(cbak)
-
-    return cbak
+    return composite_measures(wss_dist, None, pesq_raw, seg_snr)["CBAK"]
@@ -0,0 +1,52 @@
+import numpy as np
+from pesq import pesq
+
+from vyvodata.tools.speechscore.basis import ScoreBasis
+from vyvodata.tools.speechscore.scores.helper import (
+    composite_measures,
+    llr,
+    ssnr,
+    trimmed_mean,
+    wss,
+)
+
+COMPOSITE_NAMES = ("CSIG", "CBAK", "COVL")
+
+
+class Composite(ScoreBasis):
+    """CSIG, CBAK and COVL computed together from a single WSS/LLR/PESQ pass.
+    Only the measures in `names` are computed."""
+
+    def __init__(self, names=COMPOSITE_NAMES):
+        super().__init__(name="COMPOSITE")
+        self.score_rate = 16000
+        self.names = tuple(names)
+
+    def windowed_scoring(self, audios, score_rate):
+        if len(audios) != 2:
+            raise ValueError("COMPOSITE needs a reference and a test signals.")
+        return cal_composites(audios[0], audios[1], score_rate, self.names)
+
+
+def cal_composites(target_wav, pred_wav, fs, names=COMPOSITE_NAMES):
+    alpha = 0.95
+
+    # Compute WSS measure
+    wss_dist = trimmed_mean(wss(target_wav, pred_wav, fs), alpha)
+
+    # Compute LLR measure, used by CSIG and COVL
+    llr_mean = None
+    if "CSIG" in names or "COVL" in names:
+        llr_mean = trimmed_mean(llr(target_wav, pred_wav, fs), alpha)
+
+    # Compute the PESQ
+    pesq_raw = pesq(fs, target_wav, pred_wav, "wb")
+
+    # Compute the SSNR, used by CBAK only (ssnr rescales its inputs in place)
+    seg_snr = None
+    if "CBAK" in names:
+        snr_mean, seg_snr_mean = ssnr(target_wav.copy(), pred_wav.copy(), fs)
+        seg_snr = np.mean(seg_snr_mean)
+
+    measures = composite_measures(wss_dist, llr_mean, pesq_raw, seg_snr)
+    return {name: measures[name] for name in names}
@@ -1,8 +1,12 @@
-import numpy as np
 from pesq import pesq
 
 from vyvodata.tools.speechscore.basis import ScoreBasis
-from vyvodata.tools.speechscore.scores.helper import llr, norm_mos, wss
+from vyvodata.tools.speechscore.scores.helper import (
+    composite_measures,
+    llr,
+    trimmed_mean,
+    wss,
+)
 
 
 class COVL(ScoreBasis):
@@ -21,22 +25,13 @@ def cal_covl(target_wav, pred_wav, fs):
     alpha = 0.95
 
     # Compute WSS measure
-    wss_dist_vec = wss(target_wav, pred_wav, fs)
-    wss_dist_vec = sorted(wss_dist_vec, reverse=False)
-    wss_dist = np.mean(wss_dist_vec[: int(round(len(wss_dist_vec) * alpha))])
+    wss_dist = trimmed_mean(wss(target_wav, pred_wav, fs), alpha)
 
     # Compute LLR measure
-    llr_dist = llr(target_wav, pred_wav, fs)
-    llr_dist = sorted(llr_dist, reverse=False)
-    llrs = llr_dist
-    llr_len = round(len(llr_dist) * alpha)
-    llr_mean = np.mean(llrs[:llr_len])
+    llr_mean = trimmed_mean(llr(target_wav, pred_wav, fs), alpha)
 
     # Compute the PESQ
     pesq_raw = pesq(fs, target_wav, pred_wav, "wb")
 
     # covl
-    covl = 1.594 + 0.805 * pesq_raw - 0.512 * llr_mean - 0.007 * wss_dist
-    covl = norm_mos(covl)
-
-    return covl
+    return composite_measures(wss_dist, llr_mean, pesq_raw, None)["COVL"]
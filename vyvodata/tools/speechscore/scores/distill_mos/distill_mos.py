@@ -1,19 +1,72 @@
-import numpy as np
+import threading
+from functools import lru_cache
+
 import torch
+from torch.nn.utils.rnn import pad_sequence
 
 from vyvodata.tools.speechscore.basis import ScoreBasis
-from vyvodata.tools.speechscore.scores.distill_mos.sqa import ConvTransformerSQAModel
+from vyvodata.tools.speechscore.scores.distill_mos.sqa import (
+    SEQ_LEN,
+    ConvTransformerSQAModel,
+)
+
+_model_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load_distillmos(device):
+    model = ConvTransformerSQAModel().to(device)
+    model.eval()
+    return model
+
+
+def _get_distillmos(device):
+    """the DistillMOS model of a device, loaded once per process and shared by
+    every DistillMos score."""
+    with _model_lock:
+        return _load_distillmos(device)
 
 
 class DistillMos(ScoreBasis):
-    def __init__(self):
+    def __init__(self, device="auto", dtype=torch.float16):
         super().__init__(name="DISTILL_MOS")
         self.intrusive = False
+        # the model stays in the main process, on its device
+        self.parallel = False
         self.score_rate = 16000
-        self.model = ConvTransformerSQAModel()
-        self.model.eval()
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = torch.device(device)
+        # reduced precision is only used on GPU, through autocast. The weights
+        # stay in float32 because the STFT front-end has no half-precision
+        # kernel for its 320-point transform
+        self.dtype = dtype if self.device.type == "cuda" else torch.float32
+        self.model = _get_distillmos(self.device)
 
     def windowed_scoring(self, audios, score_rate):
-        score = self.model(torch.from_numpy(np.expand_dims(audios[0], axis=0)).float())
-        score_np = score.detach().cpu().numpy()
-        return score_np[0][0]
+        return self.batched_windowed_scoring([audios], score_rate)[0]
+
+    def batched_windowed_scoring(self, audios_list, score_rate):
+        # Clips up to SEQ_LEN samples are zero-padded to a single segment by the
+        # model anyway, so they share one forward pass. Longer clips are segmented
+        # according to their own length and keep a pass each.
+        waves = [torch.from_numpy(audios[0]).float() for audios in audios_list]
+        scores = [None] * len(waves)
+        short = [i for i, wave in enumerate(waves) if wave.shape[0] <= SEQ_LEN]
+
+        with torch.inference_mode(), torch.autocast(
+            self.device.type, dtype=self.dtype, enabled=self.dtype != torch.float32
+        ):
+            if short:
+                batch = pad_sequence([waves[i] for i in short], batch_first=True)
+                batch_scores = self._predict(batch)
+                for i, score in zip(short, batch_scores):
+                    scores[i] = score[0]
+            for i, wave in enumerate(waves):
+                if scores[i] is None:
+                    scores[i] = self._predict(wave[None])[0][0]
+        return scores
+
+    def _predict(self, batch):
+        batch = batch.to(self.device, non_blocking=True)
+        return self.model(batch).float().cpu().numpy()
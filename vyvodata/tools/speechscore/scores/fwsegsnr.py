@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import librosa
 import numpy as np
 
@@ -15,6 +17,11 @@ class FWSEGSNR(ScoreBasis):
         return fwsegsnr(audios[1], audios[0], score_rate)
 
 
+@lru_cache(maxsize=8)
+def mel_filterbank(fs, n_fft, n_mels):
+    return librosa.filters.mel(sr=fs, n_fft=n_fft, n_mels=n_mels, fmin=0, fmax=fs / 2)
+
+
 def fwsegsnr(x, y, fs, frame_sz=0.025, shift_sz=0.01, win="hann", numband=23):
     epsilon = np.finfo(np.float32).eps
     frame = int(np.fix(frame_sz * fs))
@@ -22,8 +29,8 @@ def fwsegsnr(x, y, fs, frame_sz=0.025, shift_sz=0.01, win="hann", numband=23):
     window = win
     nband = numband
     fftpt = int(2 ** np.ceil(np.log2(np.abs(frame))))
-    x = x / np.sqrt(sum(np.power(x, 2)))
-    y = y / np.sqrt(sum(np.power(y, 2)))
+    x = x / np.sqrt(np.sum(np.power(x, 2)))
+    y = y / np.sqrt(np.sum(np.power(y, 2)))
 
     assert len(x) == len(y), print("Wav length are not matched!")
     x_stft = np.abs(
@@ -47,12 +54,11 @@ def fwsegsnr(x, y, fs, frame_sz=0.025, shift_sz=0.01, win="hann", numband=23):
         )
     )
 
-    x_mel = librosa.feature.melspectrogram(
-        S=x_stft, sr=fs, n_mels=nband, fmin=0, fmax=fs / 2
-    )
-    y_mel = librosa.feature.melspectrogram(
-        S=y_stft, sr=fs, n_mels=nband, fmin=0, fmax=fs / 2
-    )
+    # Same projection as librosa.feature.melspectrogram(S=...), which applies
+    # the mel basis to the magnitude spectrogram as given
+    mel_basis = mel_filterbank(fs, fftpt, nband)
+    x_mel = mel_basis @ x_stft
+    y_mel = mel_basis @ y_stft
 
     # Calculate SNR.
 
@@ -2,85 +2,14 @@
 Modifications in Metrics
 """
 
-import numpy as np
-from scipy.linalg import toeplitz
-
-
-# ----------------------------- HELPERS ------------------------------------ #
-def norm_mos(val):
-    return min(max(val, 1), 5)
-
-
-# -------------------------------------------------------------------------- #
-def ssnr(ref_wav, deg_wav, srate=16000, eps=1e-10):
-    """Segmental Signal-to-Noise Ratio Objective Speech Quality Measure
-    This function implements the segmental signal-to-noise ratio
-    as defined in [1, p. 45] (see Equation 2.12).
-    """
-    clean_speech = ref_wav
-    processed_speech = deg_wav
-    clean_length = ref_wav.shape[0]
-
-    # scale both to have same dynamic range. Remove DC too.
-    clean_speech -= clean_speech.mean()
-    processed_speech -= processed_speech.mean()
-    processed_speech *= np.max(np.abs(clean_speech)) / np.max(np.abs(processed_speech))
-
-    # Signal-to-Noise Ratio
-    dif = ref_wav - deg_wav
-    overall_snr = 10 * np.log10(np.sum(ref_wav**2) / (np.sum(dif**2) + 10e-20))
-    # global variables
-    winlength = int(np.round(30 * srate / 1000))  # 30 msecs
-    skiprate = winlength // 4
-    min_snr = -10
-    max_snr = 35
-
-    # For each frame, calculate SSNR
-    num_frames = int(clean_length / skiprate - (winlength / skiprate))
-    start = 0
-    time = np.linspace(1, winlength, winlength) / (winlength + 1)
-    window = 0.5 * (1 - np.cos(2 * np.pi * time))
-    segmental_snr = []
-
-    for frame_count in range(int(num_frames)):
-        # (1) get the frames for the test and ref speech.
-        # Apply Hanning Window
-        clean_frame = clean_speech[start : start + winlength]
-        processed_frame = processed_speech[start : start + winlength]
-        clean_frame = clean_frame * window
-        processed_frame = processed_frame * window
-
-        # (2) Compute Segmental SNR
-        signal_energy = np.sum(clean_frame**2)
-        noise_energy = np.sum((clean_frame - processed_frame) ** 2)
-        segmental_snr.append(10 * np.log10(signal_energy / (noise_energy + eps) + eps))
-        segmental_snr[-1] = max(segmental_snr[-1], min_snr)
-        segmental_snr[-1] = min(segmental_snr[-1], max_snr)
-        start += int(skiprate)
-    return overall_snr, segmental_snr
-
+from functools import lru_cache
 
-def wss(ref_wav, deg_wav, srate):
-    clean_speech = ref_wav
-    processed_speech = deg_wav
-    clean_length = ref_wav.shape[0]
-    processed_length = deg_wav.shape[0]
-
-    assert clean_length == processed_length, clean_length
-
-    winlength = round(30 * srate / 1000.0)  # 240 wlen in samples
-    skiprate = np.floor(winlength / 4)
-    max_freq = srate / 2
-    num_crit = 25  # num of critical bands
-
-    n_fft = int(2 ** np.ceil(np.log(2 * winlength) / np.log(2)))
-    n_fftby2 = int(n_fft / 2)
-    kmax = 20
-    klocmax = 1
-
-    # Critical band filter definitions (Center frequency and BW in Hz)
+import numpy as np
+from numba import njit
 
-    cent_freq = [
+# Critical band filter definitions (Center frequency and BW in Hz)
+CENT_FREQ = np.array(
+    [
         50.0,
         120,
         190,
@@ -107,7 +36,9 @@ def wss(ref_wav, deg_wav, srate):
         3276.17,
         3597.63,
     ]
-    bandwidth = [
+)
+BANDWIDTH = np.array(
+    [
         70.0,
         70,
         70,
@@ -134,98 +65,154 @@ def wss(ref_wav, deg_wav, srate):
         321.465,
         346.136,
     ]
+)
+
+
+# ----------------------------- HELPERS ------------------------------------ #
+def norm_mos(val):
+    return min(max(val, 1), 5)
+
+
+def trimmed_mean(vec, alpha):
+    """mean of the round(len(vec) * alpha) smallest values of vec."""
+    vec = np.asarray(vec)
+    k = int(round(len(vec) * alpha))
+    if k >= len(vec):
+        return vec.mean()
+    return np.partition(vec, k)[:k].mean()
+
+
+def composite_measures(wss_dist, llr_mean, pesq_raw, seg_snr):
+    """CSIG, CBAK and COVL clipped to the MOS range, from their regression terms.
+    CSIG and COVL are left out when llr_mean is None, CBAK when seg_snr is None."""
+    measures = {}
+    if llr_mean is not None:
+        csig = 3.093 - 1.029 * llr_mean + 0.603 * pesq_raw - 0.009 * wss_dist
+        measures["CSIG"] = float(norm_mos(csig))
+    if seg_snr is not None:
+        cbak = 1.634 + 0.478 * pesq_raw - 0.007 * wss_dist + 0.063 * seg_snr
+        measures["CBAK"] = norm_mos(cbak)
+    if llr_mean is not None:
+        covl = 1.594 + 0.805 * pesq_raw - 0.512 * llr_mean - 0.007 * wss_dist
+        measures["COVL"] = norm_mos(covl)
+    return measures
+
+
+@lru_cache(maxsize=8)
+def hanning_window(winlength):
+    time = np.linspace(1, winlength, winlength) / (winlength + 1)
+    return 0.5 * (1 - np.cos(2 * np.pi * time))
+
+
+def windowed_frames(speech, winlength, skiprate, num_frames):
+    """(num_frames, winlength) view of the Hanning-windowed analysis frames."""
+    frames = np.lib.stride_tricks.sliding_window_view(speech, winlength)
+    return frames[::skiprate][:num_frames] * hanning_window(winlength)
 
-    bw_min = bandwidth[0]  # min critical bandwidth
 
+@lru_cache(maxsize=8)
+def critical_band_filters(n_fftby2, max_freq):
     # set up critical band filters. Note here that Gaussianly shaped filters
     # are used. Also, the sum of the filter weights are equivalent for each
     # critical band filter. Filter less than -30 dB and set to zero.
-
+    bw_min = BANDWIDTH[0]  # min critical bandwidth
     min_factor = np.exp(-30.0 / (2 * 2.303))  # -30 dB point of filter
 
-    crit_filter = np.zeros((num_crit, n_fftby2))
-    all_f0 = []
-    for i in range(num_crit):
-        f0 = (cent_freq[i] / max_freq) * (n_fftby2)
-        all_f0.append(np.floor(f0))
-        bw = (bandwidth[i] / max_freq) * (n_fftby2)
-        norm_factor = np.log(bw_min) - np.log(bandwidth[i])
-        j = list(range(n_fftby2))
-        crit_filter[i, :] = np.exp(-11 * (((j - np.floor(f0)) / bw) ** 2) + norm_factor)
-        crit_filter[i, :] = crit_filter[i, :] * (crit_filter[i, :] > min_factor)
-    # For each frame of input speech, compute Weighted Spectral Slope Measure
+    f0 = np.floor((CENT_FREQ / max_freq) * n_fftby2)[:, None]
+    bw = ((BANDWIDTH / max_freq) * n_fftby2)[:, None]
+    norm_factor = (np.log(bw_min) - np.log(BANDWIDTH))[:, None]
+    j = np.arange(n_fftby2)[None, :]
+    crit_filter = np.exp(-11 * (((j - f0) / bw) ** 2) + norm_factor)
+    return crit_filter * (crit_filter > min_factor)
+
+
+# -------------------------------------------------------------------------- #
+@njit(cache=True, fastmath=True)
+def _segmental_snr(clean_frames, processed_frames, eps, min_snr, max_snr):
+    num_frames, winlength = clean_frames.shape
+    segmental_snr = np.empty(num_frames)
+    for t in range(num_frames):
+        signal_energy = 0.0
+        noise_energy = 0.0
+        for n in range(winlength):
+            signal_energy += clean_frames[t, n] ** 2
+            noise_energy += (clean_frames[t, n] - processed_frames[t, n]) ** 2
+        snr = 10 * np.log10(signal_energy / (noise_energy + eps) + eps)
+        segmental_snr[t] = min(max(snr, min_snr), max_snr)
+    return segmental_snr
+
+
+def ssnr(ref_wav, deg_wav, srate=16000, eps=1e-10):
+    """Segmental Signal-to-Noise Ratio Objective Speech Quality Measure
+    This function implements the segmental signal-to-noise ratio
+    as defined in [1, p. 45] (see Equation 2.12).
+    """
+    clean_speech = ref_wav
+    processed_speech = deg_wav
+    clean_length = ref_wav.shape[0]
 
-    # num of frames
+    # scale both to have same dynamic range. Remove DC too.
+    clean_speech -= clean_speech.mean()
+    processed_speech -= processed_speech.mean()
+    processed_speech *= np.max(np.abs(clean_speech)) / np.max(np.abs(processed_speech))
+
+    # Signal-to-Noise Ratio
+    dif = ref_wav - deg_wav
+    overall_snr = 10 * np.log10(np.sum(ref_wav**2) / (np.sum(dif**2) + 10e-20))
+    # global variables
+    winlength = int(np.round(30 * srate / 1000))  # 30 msecs
+    skiprate = winlength // 4
+    min_snr = -10
+    max_snr = 35
+
+    # For each frame, calculate SSNR
     num_frames = int(clean_length / skiprate - (winlength / skiprate))
-    start = 0  # starting sample
-    time = np.linspace(1, winlength, winlength) / (winlength + 1)
-    window = 0.5 * (1 - np.cos(2 * np.pi * time))
-    distortion = []
-
-    for frame_count in range(num_frames):
-        # (1) Get the Frames for the test and reference speeech.
-        # Multiply by Hanning window.
-        clean_frame = clean_speech[start : start + winlength]
-        processed_frame = processed_speech[start : start + winlength]
-        clean_frame = clean_frame * window
-        processed_frame = processed_frame * window
-
-        # (2) Compuet Power Spectrum of clean and processed
-
-        clean_spec = np.abs(np.fft.fft(clean_frame, n_fft)) ** 2
-        processed_spec = np.abs(np.fft.fft(processed_frame, n_fft)) ** 2
-        clean_energy = [None] * num_crit
-        processed_energy = [None] * num_crit
-        # (3) Compute Filterbank output energies (in dB)
-        for i in range(num_crit):
-            clean_energy[i] = np.sum(clean_spec[:n_fftby2] * crit_filter[i, :])
-            processed_energy[i] = np.sum(processed_spec[:n_fftby2] * crit_filter[i, :])
-        clean_energy = np.array(clean_energy).reshape(-1, 1)
-        eps = np.ones((clean_energy.shape[0], 1)) * 1e-10
-        clean_energy = np.concatenate((clean_energy, eps), axis=1)
-        clean_energy = 10 * np.log10(np.max(clean_energy, axis=1))
-        processed_energy = np.array(processed_energy).reshape(-1, 1)
-        processed_energy = np.concatenate((processed_energy, eps), axis=1)
-        processed_energy = 10 * np.log10(np.max(processed_energy, axis=1))
-        # (4) Compute Spectral Shape (dB[i+1] - dB[i])
-
-        clean_slope = clean_energy[1:num_crit] - clean_energy[: num_crit - 1]
-        processed_slope = (
-            processed_energy[1:num_crit] - processed_energy[: num_crit - 1]
-        )
-        # (5) Find the nearest peak locations in the spectra to each
-        # critical band. If the slope is negative, we search
-        # to the left. If positive, we search to the right.
-        clean_loc_peak = []
-        processed_loc_peak = []
-        for i in range(num_crit - 1):
-            if clean_slope[i] > 0:
-                # search to the right
-                n = i
-                while n < num_crit - 1 and clean_slope[n] > 0:
-                    n += 1
-                clean_loc_peak.append(clean_energy[n - 1])
-            else:
-                # search to the left
-                n = i
-                while n >= 0 and clean_slope[n] <= 0:
-                    n -= 1
-                clean_loc_peak.append(clean_energy[n + 1])
-            # find the peaks in the processed speech signal
-            if processed_slope[i] > 0:
-                n = i
-                while n < num_crit - 1 and processed_slope[n] > 0:
-                    n += 1
-                processed_loc_peak.append(processed_energy[n - 1])
-            else:
-                n = i
-                while n >= 0 and processed_slope[n] <= 0:
-                    n -= 1
-                processed_loc_peak.append(processed_energy[n + 1])
-        # (6) Compuet the WSS Measure for this frame. This includes
-        # determination of the weighting functino
-        dbmax_clean = max(clean_energy)
-        dbmax_processed = max(processed_energy)
+    if num_frames <= 0:
+        return overall_snr, np.empty(0)
+    clean_frames = windowed_frames(clean_speech, winlength, skiprate, num_frames)
+    processed_frames = windowed_frames(
+        processed_speech, winlength, skiprate, num_frames
+    )
+    segmental_snr = _segmental_snr(
+        clean_frames, processed_frames, eps, float(min_snr), float(max_snr)
+    )
+    return overall_snr, segmental_snr
+
+
+@njit(cache=True)
+def _nearest_peaks(energy, slope):
+    # Find the nearest peak locations in the spectra to each
+    # critical band. If the slope is negative, we search
+    # to the left. If positive, we search to the right.
+    num_crit = energy.shape[0]
+    loc_peak = np.empty(num_crit - 1)
+    for i in range(num_crit - 1):
+        n = i
+        if slope[i] > 0:
+            while n < num_crit - 1 and slope[n] > 0:
+                n += 1
+            loc_peak[i] = energy[n - 1]
+        else:
+            while n >= 0 and slope[n] <= 0:
+                n -= 1
+            loc_peak[i] = energy[n + 1]
+    return loc_peak
+
+
+@njit(cache=True, fastmath=True)
+def _wss_distortion(clean_energy, processed_energy, kmax, klocmax):
+    num_frames, num_crit = clean_energy.shape
+    distortion = np.empty(num_frames)
+    for t in range(num_frames):
+        clean_e = clean_energy[t]
+        processed_e = processed_energy[t]
+        # Compute Spectral Shape (dB[i+1] - dB[i])
+        clean_slope = clean_e[1:] - clean_e[:-1]
+        processed_slope = processed_e[1:] - processed_e[:-1]
+        clean_loc_peak = _nearest_peaks(clean_e, clean_slope)
+        processed_loc_peak = _nearest_peaks(processed_e, processed_slope)
+        dbmax_clean = np.max(clean_e)
+        dbmax_processed = np.max(processed_e)
         # The weights are calculated by averaging individual
         # weighting factors from the clean and processed frame.
         # These weights w_clean and w_processed should range
@@ -233,32 +220,120 @@ def wss(ref_wav, deg_wav, srate):
         # peaks and less emphasis on slope differences in spectral
         # valleys.  This procedure is described on page 1280 of
         # Klatt's 1982 ICASSP paper.
-        clean_loc_peak = np.array(clean_loc_peak)
-        processed_loc_peak = np.array(processed_loc_peak)
-        wmax_clean = kmax / (kmax + dbmax_clean - clean_energy[: num_crit - 1])
-        wlocmax_clean = klocmax / (
-            klocmax + clean_loc_peak - clean_energy[: num_crit - 1]
-        )
-        w_clean = wmax_clean * wlocmax_clean
-        wmax_processed = kmax / (
-            kmax + dbmax_processed - processed_energy[: num_crit - 1]
-        )
-        wlocmax_processed = klocmax / (
-            klocmax + processed_loc_peak - processed_energy[: num_crit - 1]
-        )
-        w_processed = wmax_processed * wlocmax_processed
-        w = (w_clean + w_processed) / 2
-        distortion.append(
-            np.sum(
-                w * (clean_slope[: num_crit - 1] - processed_slope[: num_crit - 1]) ** 2
+        weighted_sum = 0.0
+        weight_total = 0.0
+        for i in range(num_crit - 1):
+            w_clean = (kmax / (kmax + dbmax_clean - clean_e[i])) * (
+                klocmax / (klocmax + clean_loc_peak[i] - clean_e[i])
             )
-        )
-
+            w_processed = (kmax / (kmax + dbmax_processed - processed_e[i])) * (
+                klocmax / (klocmax + processed_loc_peak[i] - processed_e[i])
+            )
+            w = (w_clean + w_processed) / 2
+            weighted_sum += w * (clean_slope[i] - processed_slope[i]) ** 2
+            weight_total += w
         # this normalization is not part of Klatt's paper, but helps
         # to normalize the meaasure. Here we scale the measure by the sum of the
         # weights
-        distortion[frame_count] = distortion[frame_count] / np.sum(w)
-        start += int(skiprate)
+        distortion[t] = weighted_sum / weight_total
+    return distortion
+
+
+def wss(ref_wav, deg_wav, srate):
+    clean_speech = ref_wav
+    processed_speech = deg_wav
+    clean_length = ref_wav.shape[0]
+    processed_length = deg_wav.shape[0]
+
+    assert clean_length == processed_length, clean_length
+
+    winlength = round(30 * srate / 1000.0)  # 240 wlen in samples
+    skiprate = int(np.floor(winlength / 4))
+    max_freq = srate / 2
+
+    n_fft = int(2 ** np.ceil(np.log(2 * winlength) / np.log(2)))
+    n_fftby2 = int(n_fft / 2)
+    kmax = 20
+    klocmax = 1
+
+    crit_filter = critical_band_filters(n_fftby2, max_freq)
+
+    # For each frame of input speech, compute Weighted Spectral Slope Measure
+    num_frames = int(clean_length / skiprate - (winlength / skiprate))
+    if num_frames <= 0:
+        return np.empty(0)
+    clean_frames = windowed_frames(clean_speech, winlength, skiprate, num_frames)
+    processed_frames = windowed_frames(
+        processed_speech, winlength, skiprate, num_frames
+    )
+
+    # Compute Power Spectrum of clean and processed
+    clean_spec = np.abs(np.fft.fft(clean_frames, n_fft, axis=1)[:, :n_fftby2]) ** 2
+    processed_spec = (
+        np.abs(np.fft.fft(processed_frames, n_fft, axis=1)[:, :n_fftby2]) ** 2
+    )
+
+    # Compute Filterbank output energies (in dB)
+    clean_energy = 10 * np.log10(np.maximum(clean_spec @ crit_filter.T, 1e-10))
+    processed_energy = 10 * np.log10(np.maximum(processed_spec @ crit_filter.T, 1e-10))
+    return _wss_distortion(clean_energy, processed_energy, float(kmax), float(klocmax))
+
+
+@njit(cache=True, fastmath=True)
+def _autocorrelation(speech_frame, model_order):
+    winlength = speech_frame.shape[0]
+    r = np.zeros(model_order + 1)
+    for k in range(model_order + 1):
+        for n in range(winlength - k):
+            r[k] += speech_frame[n] * speech_frame[n + k]
+    return r
+
+
+# error_model="numpy": silent frames give e[0] = 0, and the division must yield
+# NaN (mapped to 0 by nan_to_num in llr) rather than raise ZeroDivisionError
+@njit(cache=True, error_model="numpy")
+def _levinson_durbin(r, model_order):
+    a = np.ones(model_order)
+    a_past = np.empty(model_order)
+    e = np.zeros(model_order + 1)
+    rcoeff = np.zeros(model_order)
+    e[0] = r[0]
+    for i in range(model_order):
+        sum_term = 0.0
+        for j in range(i):
+            a_past[j] = a[j]
+            sum_term += a[j] * r[i - j]
+        rcoeff[i] = (r[i + 1] - sum_term) / e[i]
+        a[i] = rcoeff[i]
+        for j in range(i):
+            a[j] = a_past[j] - rcoeff[i] * a_past[i - 1 - j]
+        e[i + 1] = (1 - rcoeff[i] * rcoeff[i]) * e[i]
+    lpparams = np.empty(model_order + 1)
+    lpparams[0] = 1.0
+    lpparams[1:] = -a
+    return rcoeff, lpparams
+
+
+@njit(cache=True, error_model="numpy")
+def _llr_distortion(clean_frames, processed_frames, model_order):
+    num_frames = clean_frames.shape[0]
+    distortion = np.empty(num_frames)
+    for t in range(num_frames):
+        # Get the autocorrelation lags and LPC params used
+        # to compute the LLR measure
+        r_clean = _autocorrelation(clean_frames[t], model_order)
+        r_processed = _autocorrelation(processed_frames[t], model_order)
+        a_clean = _levinson_durbin(r_clean, model_order)[1]
+        a_processed = _levinson_durbin(r_processed, model_order)[1]
+        # Compute the LLR measure, a^T toeplitz(r_clean) a for both LPC sets
+        numerator = 0.0
+        denominator = 0.0
+        for i in range(model_order + 1):
+            for j in range(model_order + 1):
+                r_ij = r_clean[abs(i - j)]
+                numerator += a_processed[i] * r_ij * a_processed[j]
+                denominator += a_clean[i] * r_ij * a_clean[j]
+        distortion[t] = np.log(numerator / denominator)
     return distortion
 
 
@@ -271,7 +346,7 @@ def llr(ref_wav, deg_wav, srate):
     assert clean_length == processed_length, clean_length
 
     winlength = round(30 * srate / 1000.0)  # 240 wlen in samples
-    skiprate = np.floor(winlength / 4)
+    skiprate = int(np.floor(winlength / 4))
     if srate < 10000:
         # LPC analysis order
         p = 10
@@ -279,85 +354,41 @@ def llr(ref_wav, deg_wav, srate):
         p = 16
 
     # For each frame of input speech, calculate the Log Likelihood Ratio
-
     num_frames = int(clean_length / skiprate - (winlength / skiprate))
-    start = 0
-    time = np.linspace(1, winlength, winlength) / (winlength + 1)
-    window = 0.5 * (1 - np.cos(2 * np.pi * time))
-    distortion = []
-
-    for frame_count in range(num_frames):
-        # (1) Get the Frames for the test and reference speeech.
-        # Multiply by Hanning window.
-        clean_frame = clean_speech[start : start + winlength]
-        processed_frame = processed_speech[start : start + winlength]
-        clean_frame = clean_frame * window
-        processed_frame = processed_frame * window
-        # (2) Get the autocorrelation logs and LPC params used
-        # to compute the LLR measure
-        r_clean, ref_clean, a_clean = lpcoeff(clean_frame, p)
-        r_processed, ref_processed, a_processed = lpcoeff(processed_frame, p)
-        a_clean = a_clean[None, :]
-        a_processed = a_processed[None, :]
-        # print('A_clean shape: ', A_clean.shape)
-        # print('toe(R_clean) shape: ', toeplitz(R_clean).shape)
-        # print('A_clean: ', A_clean)
-        # print('A_processed: ', A_processed)
-        # print('toe(R_clean): ', toeplitz(R_clean))
-        # (3) Compute the LLR measure
-        numerator = a_processed.dot(toeplitz(r_clean)).dot(a_processed.T)
-        # print('num_1: {}'.format(a_processed.dot(toeplitz(r_clean))))
-        # print('num: ', numerator)
-        denominator = a_clean.dot(toeplitz(r_clean)).dot(a_clean.T)
-        # print('den: ', denominator)
-        # log_ = np.log(max(numerator / denominator, 10e-20))
-        # print('R_clean: ', R_clean)
-        # print('num: ', numerator)
-        # print('den: ', denominator)
-        # raise NotImplementedError
-        log_ = np.log(numerator / denominator)
-        # print('np.log({}/{}) = {}'.format(numerator, denominator, log_))
-        distortion.append(np.squeeze(log_))
-        start += int(skiprate)
-    return np.nan_to_num(np.array(distortion))
+    if num_frames <= 0:
+        return np.empty(0)
+    clean_frames = windowed_frames(clean_speech, winlength, skiprate, num_frames)
+    processed_frames = windowed_frames(
+        processed_speech, winlength, skiprate, num_frames
+    )
+    distortion = _llr_distortion(clean_frames, processed_frames, p)
+    return np.nan_to_num(distortion)
 
 
 def lpcoeff(speech_frame, model_order):
     # (1) Compute Autocor lags
-    # max?
-    winlength = speech_frame.shape[0]
-    r = []
-    # r = [0] * (model_order + 1)
-    for k in range(model_order + 1):
-        first = speech_frame[: (winlength - k)]
-        second = speech_frame[k:winlength]
-        # raise NotImplementedError
-        r.append(np.sum(first * second))
-        # r[k] = np.sum( first * second)
+    r = _autocorrelation(np.ascontiguousarray(speech_frame, dtype=float), model_order)
     # (2) Lev-Durbin
-    a = np.ones((model_order,))
-    e = np.zeros((model_order + 1,))
-    rcoeff = np.zeros((model_order,))
-    e[0] = r[0]
-    for i in range(model_order):
-        if i == 0:
-            sum_term = 0
-        else:
-            a_past = a[:i]
-            sum_term = np.sum(a_past * np.array(r[i:0:-1]))
-        rcoeff[i] = (r[i + 1] - sum_term) / e[i]
-        a[i] = rcoeff[i]
-        if i > 0:
-            a[:i] = a_past[:i] - rcoeff[i] * a_past[::-1]
-        e[i + 1] = (1 - rcoeff[i] * rcoeff[i]) * e[i]
+    rcoeff, lpparams = _levinson_durbin(r, model_order)
     acorr = np.array(r, dtype=np.float32)
     refcoeff = np.array(rcoeff, dtype=np.float32)
-    a = a * -1
-    lpparams = np.array([1] + list(a), dtype=np.float32)
-    acorr = np.array(acorr, dtype=np.float32)
-    refcoeff = np.array(refcoeff, dtype=np.float32)
     lpparams = np.array(lpparams, dtype=np.float32)
     return acorr, refcoeff, lpparams
 
 
+def compile_kernels():
+    """Run the jitted kernels once on a short signal so that numba compiles
+    them before the first file is scored."""
+    rng = np.random.default_rng(0)
+    ref_wav = rng.standard_normal(16000)
+    deg_wav = ref_wav + 0.1 * rng.standard_normal(16000)
+    # Leading silence, so that the all-zero frame path is compiled as well
+    ref_wav[:1600] = 0.0
+    deg_wav[:800] = 0.0
+    wss(ref_wav, deg_wav, 16000)
+    llr(ref_wav, deg_wav, 16000)
+    ssnr(ref_wav.copy(), deg_wav.copy(), 16000)
+    lpcoeff(ref_wav[:480], 16)
+
+
 # -------------------------------------------------------------------------- #
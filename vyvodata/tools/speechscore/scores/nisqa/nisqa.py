@@ -1,20 +1,48 @@
 import os
+import threading
+from functools import lru_cache
+
+import torch
 
 from vyvodata.tools.speechscore.basis import ScoreBasis
 from vyvodata.tools.speechscore.scores.nisqa.cal_nisqa import load_nisqa_model
 
+_model_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load_nisqa(model_path, device):
+    return load_nisqa_model(model_path, device=device)
+
+
+def _get_nisqa(model_path, device):
+    """the NISQA model of a checkpoint and device, loaded once per process and
+    shared by every NISQA score."""
+    with _model_lock:
+        return _load_nisqa(model_path, device)
+
 
 class NISQA(ScoreBasis):
-    def __init__(self):
+    def __init__(self, device="auto", dtype=torch.float16):
         super().__init__(name="NISQA")
         self.intrusive = False
+        # the model stays in the main process, on its device
+        self.parallel = False
         self.score_rate = 48000
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = torch.device(device)
+        # reduced precision is only used on GPU, through autocast
+        self.dtype = dtype if self.device.type == "cuda" else torch.float32
         current_dir = os.path.dirname(os.path.abspath(__file__))
         model_path = os.path.join(current_dir, "weights", "nisqa.tar")
-        self.model = load_nisqa_model(model_path, device="cpu")
+        self.model = _get_nisqa(model_path, self.device)
 
     def windowed_scoring(self, audios, score_rate):
         from vyvodata.tools.speechscore.scores.nisqa.cal_nisqa import cal_nisqa
 
-        score = cal_nisqa(self.model, audios[0])
+        with torch.autocast(
+            self.device.type, dtype=self.dtype, enabled=self.dtype != torch.float32
+        ):
+            score = cal_nisqa(self.model, audios[0])
         return score
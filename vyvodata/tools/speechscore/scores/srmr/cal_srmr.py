@@ -79,14 +79,14 @@ def cal_srmr(
 
     # Computing modulation filterbank with Q = 2 and 8 channels
     mod_filter_cfs = compute_modulation_cfs(min_cf, max_cf, 8)
-    mf = modulation_filterbank(mod_filter_cfs, mfs, 2)
+    mf_b, mf_a = modulation_filterbank(mod_filter_cfs, mfs, 2)
 
     n_frames = int(1 + (gt_env.shape[1] - wlength) // winc)
     w = hamming(wlength + 1)[:-1]  # window is periodic, not symmetric
 
     energy = np.zeros((n_cochlear_filters, 8, n_frames))
     for i, ac_ch in enumerate(gt_env):
-        mod_out = modfilt(mf, ac_ch)
+        mod_out = modfilt(mf_b, mf_a, ac_ch)
         for j, mod_ch in enumerate(mod_out):
             mod_out_frame = segment_axis(
                 mod_ch, wlength, overlap=wlength - winc, end="pad"
@@ -4,12 +4,11 @@
 # MIT license: https://github.com/jfsantos/SRMRpy/blob/master/LICENSE
 
 import numpy as np
-from numpy.fft import fft, ifft
+from scipy.fft import ifft, rfft
 
-# This is copied straight from scipy.signal. The reason is that scipy.signal's version
-# will always use the fft and ifft functions from fftpack. If you have Anaconda with an MKL
-# license, you can install the package mklfft, which will plug the faster MKL FFT functions
-# into numpy.
+# This is adapted from scipy.signal. The transforms come from scipy.fft so they can run
+# multi-threaded (workers=-1). As x is real, only its one-sided spectrum is computed with
+# rfft, doubled and zero-padded over the negative frequencies before the inverse transform.
 
 
 def hilbert(x, n=None, axis=-1):
@@ -54,18 +53,17 @@ def hilbert(x, n=None, axis=-1):
     if n <= 0:
         raise ValueError("n must be positive.")
 
-    xf = fft(x, n, axis=axis)
-    h = np.zeros(n)
-    if n % 2 == 0:
-        h[0] = h[n // 2] = 1
-        h[1 : n // 2] = 2
-    else:
-        h[0] = 1
-        h[1 : (n + 1) // 2] = 2
+    xr = rfft(x, n, axis=axis, workers=-1)
+    # one-sided spectrum: double the positive frequencies (not DC nor, for an even n,
+    # Nyquist) and leave the negative ones at zero
+    xr_last = np.moveaxis(xr, axis, -1)
+    xr_last[..., 1 : (n + 1) // 2] *= 2
+    xf = np.zeros(xr_last.shape[:-1] + (n,), dtype=xr.dtype)
+    xf[..., : xr_last.shape[-1]] = xr_last
+    xf = np.moveaxis(xf, -1, axis)
 
-    if len(x.shape) > 1:
-        ind = [np.newaxis] * x.ndim
-        ind[axis] = slice(None)
-        h = h[ind]
-    y = ifft(xf * h, axis=axis)
-    return y[: x.shape[axis]]
+    y = ifft(xf, axis=axis, workers=-1)
+    # drop the padding up to a multiple of 16, along `axis`
+    crop = [slice(None)] * y.ndim
+    crop[axis] = slice(x.shape[axis])
+    return y[tuple(crop)]
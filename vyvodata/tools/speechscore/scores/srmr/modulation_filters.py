@@ -4,7 +4,7 @@
 # MIT license: https://github.com/jfsantos/SRMRpy/blob/master/LICENSE
 
 import numpy as np
-import scipy.signal as sig
+from numba import njit, prange
 
 
 def make_modulation_filter(w0, q):
@@ -18,20 +18,41 @@ def make_modulation_filter(w0, q):
 
 
 def modulation_filterbank(mf, fs, q):
-    return [make_modulation_filter(w0, q) for w0 in 2 * np.pi * mf / fs]
+    # two contiguous (K, 3) arrays of numerator and denominator coefficients,
+    # one row per filter
+    filters = [make_modulation_filter(w0, q) for w0 in 2 * np.pi * mf / fs]
+    B = np.stack([b for b, _ in filters])
+    A = np.stack([a for _, a in filters])
+    return B, A
 
 
 def compute_modulation_cfs(min_cf, max_cf, n):
-    spacing_factor = (max_cf / min_cf) ** (1.0 / (n - 1))
-    cfs = np.zeros(n)
-    cfs[0] = min_cf
-    for k in range(1, n):
-        cfs[k] = cfs[k - 1] * spacing_factor
-    return cfs
-
-
-def modfilt(filter_bank, x):
-    y = np.zeros((len(filter_bank), len(x)), dtype=float)
-    for k, f in enumerate(filter_bank):
-        y[k] = sig.lfilter(f[0], f[1], x)
+    return np.geomspace(min_cf, max_cf, num=n)
+
+
+@njit(cache=True, parallel=True)
+def _biquad_bank(B, A, x):
+    # Direct-form II transposed biquads, equivalent to scipy.signal.lfilter
+    y = np.zeros((B.shape[0], x.shape[0]))
+    for k in prange(B.shape[0]):
+        a0 = A[k, 0]
+        b0 = B[k, 0] / a0
+        b1 = B[k, 1] / a0
+        b2 = B[k, 2] / a0
+        a1 = A[k, 1] / a0
+        a2 = A[k, 2] / a0
+        z1 = 0.0
+        z2 = 0.0
+        for n in range(x.shape[0]):
+            yn = b0 * x[n] + z1
+            z1 = b1 * x[n] - a1 * yn + z2
+            z2 = b2 * x[n] - a2 * yn
+            y[k, n] = yn
     return y
+
+
+def modfilt(B, A, x):
+    B = np.ascontiguousarray(B, dtype=float)
+    A = np.ascontiguousarray(A, dtype=float)
+    x = np.ascontiguousarray(x, dtype=float)
+    return _biquad_bank(B, A, x)
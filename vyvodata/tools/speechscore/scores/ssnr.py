@@ -1,6 +1,7 @@
 import numpy as np
 
 from vyvodata.tools.speechscore.basis import ScoreBasis
+from vyvodata.tools.speechscore.scores.helper import ssnr
 
 
 class SSNR(ScoreBasis):
@@ -20,41 +21,5 @@ def cal_ssnr(ref_wav, deg_wav, srate=16000, eps=1e-10):
     This function implements the segmental signal-to-noise ratio
     as defined in [1, p. 45] (see Equation 2.12).
     """
-    clean_speech = ref_wav
-    processed_speech = deg_wav
-    clean_length = ref_wav.shape[0]
-
-    # scale both to have same dynamic range. Remove DC too.
-    clean_speech -= clean_speech.mean()
-    processed_speech -= processed_speech.mean()
-    processed_speech *= np.max(np.abs(clean_speech)) / np.max(np.abs(processed_speech))
-
-    # global variables
-    winlength = int(np.round(30 * srate / 1000))  # 30 msecs
-    skiprate = winlength // 4
-    min_snr = -10
-    max_snr = 35
-
-    # For each frame, calculate SSNR
-    num_frames = int(clean_length / skiprate - (winlength / skiprate))
-    start = 0
-    time = np.linspace(1, winlength, winlength) / (winlength + 1)
-    window = 0.5 * (1 - np.cos(2 * np.pi * time))
-    segmental_snr = []
-
-    for frame_count in range(int(num_frames)):
-        # (1) get the frames for the test and ref speech.
-        # Apply Hanning Window
-        clean_frame = clean_speech[start : start + winlength]
-        processed_frame = processed_speech[start : start + winlength]
-        clean_frame = clean_frame * window
-        processed_frame = processed_frame * window
-
-        # (2) Compute Segmental SNR
-        signal_energy = np.sum(clean_frame**2)
-        noise_energy = np.sum((clean_frame - processed_frame) ** 2)
-        segmental_snr.append(10 * np.log10(signal_energy / (noise_energy + eps) + eps))
-        segmental_snr[-1] = max(segmental_snr[-1], min_snr)
-        segmental_snr[-1] = min(segmental_snr[-1], max_snr)
-        start += int(skiprate)
-    return sum(segmental_snr) / len(segmental_snr)
+    _, segmental_snr = ssnr(ref_wav, deg_wav, srate, eps)
+    return np.mean(segmental_snr)
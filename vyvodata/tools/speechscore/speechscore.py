@@ -1,4 +1,6 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 import librosa
 import numpy as np
@@ -7,6 +9,7 @@ import soundfile as sf
 
 from vyvodata.tools.speechscore.scores.bsseval import BSSEval
 from vyvodata.tools.speechscore.scores.cbak import CBAK
+from vyvodata.tools.speechscore.scores.composite import COMPOSITE_NAMES, Composite
 from vyvodata.tools.speechscore.scores.covl import COVL
 from vyvodata.tools.speechscore.scores.csig import CSIG
 from vyvodata.tools.speechscore.scores.distill_mos.distill_mos import DistillMos
@@ -53,13 +56,26 @@ class ScoresList:
         return "Scores: " + " ".join([x.name for x in self.scores])
 
     def __call__(
-        self, test_path, reference_path, window=None, score_rate=None, return_mean=False
+        self,
+        test_path,
+        reference_path,
+        window=None,
+        score_rate=None,
+        return_mean=False,
+        batch_size=1,
+        num_workers=1,
     ):
         """
         window: float
             the window length in seconds to use for scoring the files.
         score_rate:
             the sampling rate specified for scoring the files.
+        batch_size: int
+            the number of files of a directory loaded and scored together.
+            Scores backed by a model run them through a single forward pass.
+        num_workers: int
+            the number of worker processes used to score the files of a
+            directory. Scores that are not `parallel` stay in the main process.
         """
         if test_path is None:
             print("Please provide audio path for test_path")
@@ -70,23 +86,30 @@ class ScoresList:
             audio_list = self.get_audio_list(test_path)
             if audio_list is None:
                 return
-            for audio_id in audio_list:
-                results_id = {}
-                if reference_path is not None:
-                    data = self.audio_reader(
-                        test_path + "/" + audio_id, reference_path + "/" + audio_id
-                    )
-                else:
-                    data = self.audio_reader(test_path + "/" + audio_id, None)
-                for score in self.scores:
-                    result_score = score.scoring(data, window, score_rate)
-                    results_id[score.name] = result_score
-                results[audio_id] = results_id
+            test_files = [test_path + "/" + audio_id for audio_id in audio_list]
+            if reference_path is not None:
+                reference_files = [
+                    reference_path + "/" + audio_id for audio_id in audio_list
+                ]
+            else:
+                reference_files = [None] * len(audio_list)
+            if num_workers > 1:
+                file_results = self.score_files_parallel(
+                    test_files,
+                    reference_files,
+                    window,
+                    score_rate,
+                    batch_size,
+                    num_workers,
+                )
+            else:
+                file_results = self.score_files(
+                    test_files, reference_files, window, score_rate, batch_size
+                )
+            results = dict(zip(audio_list, file_results))
         else:
             data = self.audio_reader(test_path, reference_path)
-            for score in self.scores:
-                result_score = score.scoring(data, window, score_rate)
-                results[score.name] = result_score
+            results = self.score_batch([data], window, score_rate)[0]
 
         if return_mean:
             mean_result = compute_mean_results(*results.values())
@@ -94,6 +117,103 @@ class ScoresList:
 
         return results
 
+    def score_files(
+        self, test_files, reference_files, window=None, score_rate=None, batch_size=1
+    ):
+        """loading and scoring the files batch_size at a time, one result dict
+        per file."""
+        file_results = []
+        for start in range(0, len(test_files), batch_size):
+            batch_data = [
+                self.audio_reader(test_file, reference_file)
+                for test_file, reference_file in zip(
+                    test_files[start : start + batch_size],
+                    reference_files[start : start + batch_size],
+                )
+            ]
+            file_results += self.score_batch(batch_data, window, score_rate)
+        return file_results
+
+    def score_files_parallel(
+        self,
+        test_files,
+        reference_files,
+        window=None,
+        score_rate=None,
+        batch_size=1,
+        num_workers=2,
+    ):
+        """scoring the `parallel` scores in a pool of worker processes, each
+        loading its own copy of them, while the remaining scores run in the
+        main process in batches."""
+        pool_names = [score.name for score in self.scores if score.parallel]
+        if not pool_names:
+            return self.score_files(
+                test_files, reference_files, window, score_rate, batch_size
+            )
+
+        main_scores = ScoresList()
+        for score in self.scores:
+            if not score.parallel:
+                main_scores += score
+
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_score_worker,
+            initargs=(pool_names,),
+        ) as executor:
+            pool_results = executor.map(
+                _score_file,
+                test_files,
+                reference_files,
+                repeat(window),
+                repeat(score_rate),
+            )
+            if main_scores.scores:
+                main_results = main_scores.score_files(
+                    test_files, reference_files, window, score_rate, batch_size
+                )
+            else:
+                main_results = [{} for _ in test_files]
+            pool_results = list(pool_results)
+
+        return [
+            {
+                score.name: (pool_result if score.parallel else main_result)[score.name]
+                for score in self.scores
+            }
+            for pool_result, main_result in zip(pool_results, main_results)
+        ]
+
+    def score_batch(self, data_list, window=None, score_rate=None):
+        """computing every score on a list of loaded inputs, one result dict per
+        input. When more than one of CSIG, CBAK and COVL is requested, their
+        shared WSS/LLR/PESQ terms are computed once through the `Composite` score."""
+        results = [{} for _ in data_list]
+        composite_results = None
+        composite_names = [
+            score.name for score in self.scores if score.name in COMPOSITE_NAMES
+        ]
+        if len(composite_names) > 1:
+            composite_results = Composite(composite_names).batched_scoring(
+                data_list, window, score_rate
+            )
+
+        for score in self.scores:
+            if composite_results is not None and score.name in COMPOSITE_NAMES:
+                if window is not None:
+                    score_results = [
+                        {t: result_t[score.name] for t, result_t in result.items()}
+                        for result in composite_results
+                    ]
+                else:
+                    score_results = [result[score.name] for result in composite_results]
+            else:
+                score_results = score.batched_scoring(data_list, window, score_rate)
+            for result, score_result in zip(results, score_results):
+                result[score.name] = score_result
+        return results
+
     def get_audio_list(self, path):
         # Initialize an empty list to store audio file names
         audio_list = []
@@ -224,3 +344,17 @@ def speech_score(scores=""):
         else:
             print("score is pending implementation...")
     return score_cls
+
+
+# scores loaded once per worker process by `ScoresList.score_files_parallel`
+_worker_scores = None
+
+
+def _init_score_worker(names):
+    global _worker_scores
+    _worker_scores = speech_score(names)
+
+
+def _score_file(test_file, reference_file, window, score_rate):
+    data = _worker_scores.audio_reader(test_file, reference_file)
+    return _worker_scores.score_batch([data], window, score_rate)[0]
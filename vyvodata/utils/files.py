@@ -0,0 +1,107 @@
+"""
+Utility functions for working with local files.
+"""
+
+import os
+from collections import defaultdict
+from typing import Any, Iterable, Iterator, List, Tuple
+
+import orjson
+
+
+def find_missing_paths(paths: Iterable[str]) -> List[str]:
+    """
+    Find the paths that do not exist, listing each parent directory once.
+
+    Checking a long list of files one `os.path.exists` call at a time costs one stat
+    per file. Here the paths are grouped by directory and every directory is read
+    with a single `os.scandir`, so the check is a set lookup per file. The names not
+    found in the listing, and those of directories that cannot be listed, are checked
+    with `os.path.exists`, so the result is the same (e.g. on case-insensitive
+    filesystems or for broken symlinks).
+
+    Args:
+        paths: Paths of the files to check
+
+    Returns:
+        List of the paths that were not found, in their original order
+    """
+    paths = list(paths)
+    names_by_dir = defaultdict(set)
+    for path in paths:
+        parent, name = os.path.split(path)
+        names_by_dir[parent].add(name)
+
+    present = {}
+    for parent in names_by_dir:
+        try:
+            with os.scandir(parent or ".") as entries:
+                # Broken symlinks are listed, but do not exist
+                present[parent] = {
+                    entry.name
+                    for entry in entries
+                    if not entry.is_symlink() or os.path.exists(entry.path)
+                }
+        except OSError:
+            present[parent] = set()
+
+    return [
+        path
+        for path in paths
+        if os.path.basename(path) not in present[os.path.dirname(path)]
+        and not os.path.exists(path)
+    ]
+
+
+def iter_folder_files(folder: str) -> Iterator[Tuple[str, str]]:
+    """
+    Recursively list the files of a folder with `os.scandir`.
+
+    Args:
+        folder: Path of the folder to list
+
+    Yields:
+        Tuples of the file path relative to `folder`, with "/" separators, and its full path
+    """
+
+    def scan(directory, prefix):
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                relative_path = f"{prefix}{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    yield from scan(entry.path, f"{relative_path}/")
+                elif entry.is_file():
+                    yield relative_path, entry.path
+
+    yield from scan(folder, "")
+
+
+def _json_default(obj):
+    # Tensors and anything else array-like that orjson does not serialize natively
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def save_json(obj: Any, path: str):
+    """
+    Save an object as indented JSON with orjson.
+
+    NumPy arrays and scalars are serialized natively, and tensors through `tolist`.
+    Non-string dict keys, such as the frame indices of windowed scores, are written
+    as strings, as `json.dump` does.
+
+    Args:
+        obj: Object to save
+        path: Path of the JSON file
+    """
+    with open(path, "wb") as f:
+        f.write(
+            orjson.dumps(
+                obj,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NON_STR_KEYS,
+            )
+        )
@@ -3,13 +3,81 @@ Utility functions for working with Hugging Face datasets.
 Includes functions for downloading audio files and specific datasets like Emilia.
 """
 
+import asyncio
+import hashlib
+import importlib.util
+import json
+import logging
 import os
-from typing import List, Optional
-
+import queue
+import random
+import shutil
+import struct
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+import aiohttp
+import numpy as np
 import soundfile as sf
-from datasets import Audio, load_dataset
+from datasets import Audio, Features, Value, load_dataset, load_dataset_builder
+from huggingface_hub import CommitOperationAdd, HfApi, snapshot_download, upload_file
+from huggingface_hub import constants as hf_constants
+from huggingface_hub.hf_api import DEFAULT_IGNORE_PATTERNS
+from huggingface_hub.utils import filter_repo_objects
 from tqdm.auto import tqdm
 
+from vyvodata.utils.files import find_missing_paths, iter_folder_files
+
+logger = logging.getLogger(__name__)
+
+# Root of the shared audio download cache, overridable with $VYVODATA_CACHE
+AUDIO_CACHE_DIR = os.environ.get(
+    "VYVODATA_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "vyvodata")
+)
+MANIFEST_NAME = "manifest.json"
+# Sample formats of the saved WAV files
+WAV_DTYPES = ("int16", "float32")
+# Maximum number of audio URLs fetched at once
+MAX_URL_CONNECTIONS = 32
+# Replaces the non alphanumeric ASCII characters of file ids with "_"
+_FILE_ID_TABLE = {i: "_" for i in range(128) if not chr(i).isalnum()}
+
+
+@contextmanager
+def _fast_transfers():
+    """
+    Enable huggingface_hub's fast transfer settings for the duration of a download.
+
+    These are hf_transfer's multi-part downloads when it is installed (huggingface_hub
+    < 1.0) and Xet's high performance mode (huggingface_hub >= 1.0). They are environment
+    variables, which huggingface_hub copies into its `constants` module when it is first
+    imported, so both are set and restored afterwards. Variables already set in the
+    environment are left as they are.
+    """
+    names = ["HF_XET_HIGH_PERFORMANCE"]
+    if importlib.util.find_spec("hf_transfer") is not None:
+        names.append("HF_HUB_ENABLE_HF_TRANSFER")
+    names = [name for name in names if name not in os.environ]
+    previous = {
+        name: getattr(hf_constants, name)
+        for name in names
+        if hasattr(hf_constants, name)
+    }
+    for name in names:
+        os.environ[name] = "1"
+    for name in previous:
+        setattr(hf_constants, name, True)
+    try:
+        yield
+    finally:
+        for name in names:
+            os.environ.pop(name, None)
+        for name, value in previous.items():
+            setattr(hf_constants, name, value)
+
 
 def download_hf(
     repo_id="kadirnar/test",
@@ -17,32 +85,41 @@ def download_hf(
     ignore_patterns=["*.md", "*..gitattributes"],
     local_dir=None,
     allow_patterns=None,
+    max_workers=None,
 ):
     """
     Downloads a model from Hugging Face Hub.
 
+    The fast transfer settings of huggingface_hub are enabled for this download only,
+    unless they are set in the environment.
+
     Args:
         repo_id (str): The repository ID on Hugging Face Hub.
         repo_type (str): Type of repository ('model', 'dataset', etc.).
         ignore_patterns (list): Patterns to ignore during download.
         local_dir (str): Local directory to save the model. Defaults to repo_id's last component.
         allow_patterns (str): Patterns to allow during download.
+        max_workers (int): Number of files downloaded concurrently.
+                           Defaults to twice the CPU count, at most 16.
 
     Returns:
         str: Path to the downloaded model.
     """
-    from huggingface_hub import snapshot_download
-
     if local_dir is None:
         local_dir = repo_id.split("/")[-1]
 
-    return snapshot_download(
-        repo_id=repo_id,
-        repo_type=repo_type,
-        ignore_patterns=ignore_patterns,
-        local_dir=local_dir,
-        allow_patterns=allow_patterns,
-    )
+    if max_workers is None:
+        max_workers = min(16, (os.cpu_count() or 1) * 2)
+
+    with _fast_transfers():
+        return snapshot_download(
+            repo_id=repo_id,
+            repo_type=repo_type,
+            ignore_patterns=ignore_patterns,
+            local_dir=local_dir,
+            allow_patterns=allow_patterns,
+            max_workers=max_workers,
+        )
 
 
 def upload_to_hub(
@@ -66,18 +143,37 @@ def upload_to_hub(
         private (bool): Whether the repository should be private.
         token (str): HuggingFace token. Will use the cached token if not provided.
         create_repo (bool): Whether to create the repository if it doesn't exist.
-        ignore_patterns (list): Patterns to ignore during upload.
+        ignore_patterns (list or str): Patterns to ignore during upload.
 
     Returns:
         str: URL of the repository on Hugging Face Hub.
-    """
-    from huggingface_hub import HfApi
 
+    Raises:
+        ValueError: If no file of local_dir is left to upload after the ignore patterns.
+    """
     if commit_message is None:
         commit_message = f"Upload {repo_type}"
 
     if ignore_patterns is None:
         ignore_patterns = [".git/**", ".gitignore", "**/.DS_Store", "**/__pycache__/**"]
+    elif isinstance(ignore_patterns, str):
+        ignore_patterns = [ignore_patterns]
+
+    # List the directory content, without the ignored files nor the .git and
+    # .cache/huggingface folders (as `upload_folder` does)
+    files = filter_repo_objects(
+        iter_folder_files(local_dir),
+        ignore_patterns=list(ignore_patterns) + DEFAULT_IGNORE_PATTERNS,
+        key=lambda file: file[0],
+    )
+    operations = [
+        CommitOperationAdd(path_in_repo=relative_path, path_or_fileobj=file_path)
+        for relative_path, file_path in files
+    ]
+    if not operations:
+        raise ValueError(
+            f"No files to upload in {local_dir} with ignore patterns {ignore_patterns}"
+        )
 
     api = HfApi(token=token)
 
@@ -87,18 +183,57 @@ def upload_to_hub(
             repo_id=repo_id, repo_type=repo_type, private=private, exist_ok=True
         )
 
-    # Upload directory content to the Hub
-    url = api.upload_folder(
-        folder_path=local_dir,
+    # Hash and upload the LFS content first, in parallel; content the Hub already has
+    # is not sent again
+    api.preupload_lfs_files(repo_id, additions=operations, repo_type=repo_type)
+
+    # Upload directory content to the Hub in a single commit
+    url = api.create_commit(
         repo_id=repo_id,
-        repo_type=repo_type,
+        operations=operations,
         commit_message=commit_message,
-        ignore_patterns=ignore_patterns,
+        repo_type=repo_type,
     )
 
     return url
 
 
+def _sha256_stream(path, chunk_size=1 << 20):
+    """SHA-256 of a file, read chunk_size bytes at a time."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _uploaded_paths(api, repo_id, repo_type, destinations):
+    """Map the local files whose LFS copy on the Hub is identical to their path in the repo."""
+    try:
+        remote_files = api.get_paths_info(
+            repo_id, list(destinations.values()), repo_type=repo_type
+        )
+    except Exception:
+        return {}
+    remote_lfs = {
+        remote.path: remote.lfs
+        for remote in remote_files
+        if getattr(remote, "lfs", None) is not None
+    }
+
+    uploaded = {}
+    for file_path, destination_path in destinations.items():
+        lfs = remote_lfs.get(destination_path)
+        # Hash only the files whose size already matches
+        if (
+            lfs is not None
+            and lfs.size == os.path.getsize(file_path)
+            and lfs.sha256 == _sha256_stream(file_path)
+        ):
+            uploaded[file_path] = destination_path
+    return uploaded
+
+
 def upload_large_files_to_hub(
     file_paths,
     repo_id,
@@ -108,11 +243,14 @@ def upload_large_files_to_hub(
     private=False,
     token=None,
     create_repo=True,
-    max_shard_size="500MB",
+    max_shard_size=None,
 ):
     """
     Uploads large files to Hugging Face Hub with chunking support.
 
+    Several files are uploaded together in a single commit. Files whose LFS copy on the
+    Hub already has the same SHA-256 are skipped.
+
     Args:
         file_paths (str or list): Path(s) to the large file(s) to upload.
         repo_id (str): The repository ID on Hugging Face Hub.
@@ -123,14 +261,19 @@ def upload_large_files_to_hub(
         private (bool): Whether the repository should be private.
         token (str): HuggingFace token. Will use the cached token if not provided.
         create_repo (bool): Whether to create the repository if it doesn't exist.
-        max_shard_size (str): Maximum size for the chunks in bytes (e.g. "500MB", "1GB").
+        max_shard_size (str): Deprecated and ignored. The Hub client splits large files into
+                           parts itself (LFS multipart or Xet chunks).
 
     Returns:
         str: URL of the repository on Hugging Face Hub.
     """
-    import os
-
-    from huggingface_hub import HfApi, upload_file
+    if max_shard_size is not None:
+        warnings.warn(
+            "max_shard_size is deprecated and ignored: huggingface_hub splits large "
+            "files into parts itself.",
+            FutureWarning,
+            stacklevel=2,
+        )
 
     if commit_message is None:
         commit_message = "Upload large files"
@@ -146,65 +289,436 @@ def upload_large_files_to_hub(
             repo_id=repo_id, repo_type=repo_type, private=private, exist_ok=True
         )
 
-    uploaded_files = []
-
-    for file_path in file_paths:
+    def destination(file_path):
         file_name = os.path.basename(file_path)
-        destination_path = (
+        return (
             file_name if path_in_repo is None else os.path.join(path_in_repo, file_name)
         )
 
+    # Skip the files that are already on the Hub with the same content
+    uploaded = _uploaded_paths(
+        api,
+        repo_id,
+        repo_type,
+        {file_path: destination(file_path) for file_path in file_paths},
+    )
+    file_paths = [file_path for file_path in file_paths if file_path not in uploaded]
+
+    if not file_paths:
+        print("All files are already uploaded, skipping")
+    elif len(file_paths) > 1:
+        # Upload all files in a single commit, their LFS parts going up concurrently
+        operations = [
+            CommitOperationAdd(
+                path_in_repo=destination(file_path), path_or_fileobj=file_path
+            )
+            for file_path in file_paths
+        ]
+        api.create_commit(
+            repo_id=repo_id,
+            operations=operations,
+            commit_message=commit_message,
+            repo_type=repo_type,
+            num_threads=min(8, len(file_paths)),
+        )
+    else:
+        file_path = file_paths[0]
+        file_name = os.path.basename(file_path)
+
         # Upload large file with potential chunking
-        url = upload_file(
+        upload_file(
             path_or_fileobj=file_path,
-            path_in_repo=destination_path,
+            path_in_repo=destination(file_path),
             repo_id=repo_id,
             repo_type=repo_type,
             token=token,
             commit_message=f"{commit_message}: {file_name}",
-            max_shard_size=max_shard_size,
         )
 
-        uploaded_files.append(url)
-
     # Return the repository URL (common to all files)
     repo_url = f"https://huggingface.co/{repo_id}"
     return repo_url
 
 
+def _download_key(dataset_name, split, audio_column, num_samples, id_column, dtype):
+    return json.dumps(
+        [dataset_name, split, audio_column, num_samples, id_column, dtype]
+    )
+
+
+def audio_cache_dir(
+    dataset_name: str,
+    split: str = "train",
+    audio_column: str = "audio",
+    num_samples: Optional[int] = None,
+    id_column: Optional[str] = None,
+    dtype: str = "int16",
+) -> str:
+    """
+    Get the shared cache directory for audio files downloaded with these arguments.
+
+    Args:
+        dataset_name: Name of the dataset on Hugging Face
+        split: Dataset split
+        audio_column: Name of the column containing audio data
+        num_samples: Number of samples downloaded (None for all)
+        id_column: Column used as the filename prefix
+        dtype: Sample format of the WAV files
+
+    Returns:
+        Path to the cache directory, under $VYVODATA_CACHE (default ~/.cache/vyvodata)
+    """
+    key = _download_key(
+        dataset_name, split, audio_column, num_samples, id_column, dtype
+    )
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(AUDIO_CACHE_DIR, digest)
+
+
+def _load_manifest(output_dir):
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.isfile(manifest_path):
+        return None
+    with open(manifest_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_manifest(output_dir, key):
+    """Return the files of a completed download into output_dir, or None."""
+    manifest = _load_manifest(output_dir)
+    if manifest is None or manifest.get("key") != key or manifest.get("partial"):
+        return None
+    prefix = os.path.join(output_dir, "")
+    files = [f"{prefix}{name}" for name in manifest["files"]]
+    if find_missing_paths(files):
+        return None
+    return files
+
+
+def _write_manifest(output_dir, key, files):
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "files": [os.path.basename(p) for p in files]}, f)
+
+
+def _start_manifest(output_dir, key):
+    """
+    Mark a download into output_dir as started, until `_write_manifest` completes it.
+
+    Returns True when it resumes a download with the same key that was interrupted, whose
+    files can be kept. Otherwise the files already in output_dir are overwritten.
+    """
+    manifest = _load_manifest(output_dir)
+    if manifest is not None and manifest.get("partial") and manifest.get("key") == key:
+        return True
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "files": [], "partial": True}, f)
+    return False
+
+
+@contextmanager
+def _atomic_path(file_path):
+    """
+    Give a temporary path next to file_path, moved into place once written.
+
+    A file under its final name is always complete: a write that fails or is interrupted
+    only leaves the temporary file, which is removed on errors.
+    """
+    part_path = f"{file_path}.part"
+    try:
+        yield part_path
+        os.replace(part_path, file_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+
+
+def _audio_file_id(item, index, id_column):
+    if id_column and id_column in item:
+        # Use the provided column as file name prefix
+        file_id = str(item[id_column])
+        # Clean up the ID to make a valid filename
+        if file_id.isascii():
+            return file_id.translate(_FILE_ID_TABLE)
+        return "".join(c if c.isalnum() else "_" for c in file_id)
+    # Use index as file name
+    return f"audio_{index:05d}"
+
+
+def _is_url(path):
+    return isinstance(path, str) and path.startswith(("http://", "https://"))
+
+
+async def _fetch_all(downloads):
+    connector = aiohttp.TCPConnector(limit=MAX_URL_CONNECTIONS)
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def fetch(url, file_path):
+            with _atomic_path(file_path) as part_path:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    with open(part_path, "wb") as f:
+                        async for chunk in response.content.iter_chunked(1 << 16):
+                            f.write(chunk)
+
+        return await asyncio.gather(
+            *(fetch(url, file_path) for url, file_path in downloads),
+            return_exceptions=True,
+        )
+
+
+def _fetch_urls(downloads):
+    """Fetch (url, file_path) pairs concurrently, returning None or the exception of each."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_fetch_all(downloads))
+    # Called from a running event loop (e.g. a notebook), use a loop of its own
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, _fetch_all(downloads)).result()
+
+
+def _save_audio(audio_data, file_path, dtype="int16"):
+    """Save one audio cell of a dataset row as a WAV file, False if its format is unsupported."""
+    if (
+        isinstance(audio_data, dict)
+        and "array" in audio_data
+        and "sampling_rate" in audio_data
+    ):
+        # Handle array format (most common from datasets)
+        _write_wav(file_path, audio_data["array"], audio_data["sampling_rate"], dtype)
+    elif isinstance(audio_data, dict) and _is_url(audio_data.get("path")):
+        # Handle URL format (download file)
+        error = _fetch_urls([(audio_data["path"], file_path)])[0]
+        if error is not None:
+            raise error
+    elif isinstance(audio_data, dict) and "path" in audio_data:
+        # Handle path format (copy file)
+        with _atomic_path(file_path) as part_path:
+            shutil.copyfile(audio_data["path"], part_path)
+    else:
+        return False
+    return True
+
+
+def _write_wav_fast(file_path, array, sampling_rate):
+    """
+    Write audio as a 16-bit PCM WAV file from a raw RIFF header and the sample bytes.
+
+    This is the file `sf.write` writes by default for a WAV, without going through
+    libsndfile for each file. Float samples are quantized like libsndfile does, and other
+    integer samples are left to `sf.write`.
+    """
+    array = np.asarray(array)
+    if np.issubdtype(array.dtype, np.floating):
+        # Float samples in [-1, 1), clipped instead of wrapping around
+        array = np.clip(np.floor(array * 32768.0), -32768, 32767).astype(np.int16)
+    elif array.dtype != np.int16:
+        # Integer samples at another full scale, rescaled by libsndfile
+        sf.write(file_path, array, sampling_rate, subtype="PCM_16", format="WAV")
+        return
+    channels = 1 if array.ndim == 1 else array.shape[1]
+    data = np.ascontiguousarray(array, dtype="<i2").tobytes()
+
+    header = (
+        b"RIFF"
+        + struct.pack("<I", 36 + len(data))
+        + b"WAVEfmt "
+        + struct.pack(
+            "<IHHIIHH",
+            16,
+            1,
+            channels,
+            sampling_rate,
+            sampling_rate * channels * 2,
+            channels * 2,
+            16,
+        )
+        + b"data"
+        + struct.pack("<I", len(data))
+    )
+    with open(file_path, "wb", buffering=1 << 20) as f:
+        f.write(header)
+        f.write(data)
+
+
+def _write_wav(file_path, array, sampling_rate, dtype="int16"):
+    """Write audio as a WAV file of 16-bit PCM ("int16") or 32-bit float ("float32") samples."""
+    with _atomic_path(file_path) as part_path:
+        if dtype == "float32":
+            # The low-level writer, with the container and subtype given up front
+            array = np.asarray(array)
+            channels = 1 if array.ndim == 1 else array.shape[1]
+            with sf.SoundFile(
+                part_path,
+                "w",
+                samplerate=sampling_rate,
+                channels=channels,
+                format="WAV",
+                subtype="FLOAT",
+            ) as out:
+                out.write(array)
+        else:
+            _write_wav_fast(part_path, array, sampling_rate)
+
+
+def _check_dtype(dtype):
+    if dtype not in WAV_DTYPES:
+        raise ValueError(f"dtype must be one of {WAV_DTYPES}, got '{dtype}'")
+
+
+def _save_decoded_audio(audio_data, file_path, dtype="int16"):
+    """Save one decoded audio cell, as given by an `Audio` feature with decode=True."""
+    _write_wav(file_path, audio_data["array"], audio_data["sampling_rate"], dtype)
+    return True
+
+
+def _is_decoded(feature):
+    """Whether the cells of an audio column are decoded arrays, resolved once per column."""
+    return isinstance(feature, Audio) and feature.decode
+
+
+def _write_audio_batch(
+    batch, indices, audio_column, id_column, output_dir, decoded, dtype, resume
+):
+    """`Dataset.map` writer saving a batch of rows, with None for the rows not saved."""
+    ids = batch[id_column] if id_column and id_column in batch else None
+    save_audio = _save_decoded_audio if decoded else _save_audio
+    prefix = os.path.join(output_dir, "")
+    paths = [None] * len(indices)
+    # Rows given by URL are fetched together once the others are written
+    downloads = []
+    for offset, (i, audio_data) in enumerate(zip(indices, batch[audio_column])):
+        item = {id_column: ids[offset]} if ids is not None else {}
+        try:
+            file_path = f"{prefix}{_audio_file_id(item, i, id_column)}.wav"
+            if resume and os.path.isfile(file_path):
+                # Written by the interrupted run being resumed
+                paths[offset] = file_path
+            elif (
+                not decoded
+                and isinstance(audio_data, dict)
+                and _is_url(audio_data.get("path"))
+            ):
+                downloads.append((offset, i, audio_data["path"], file_path))
+                paths[offset] = file_path
+            elif save_audio(audio_data, file_path, dtype):
+                paths[offset] = file_path
+            else:
+                logger.warning(f"Unsupported audio format for item {i}, skipping")
+
+        except Exception as e:
+            logger.warning(f"Error processing audio item {i}: {str(e)}")
+
+    if downloads:
+        errors = _fetch_urls([(url, file_path) for _, _, url, file_path in downloads])
+        for (offset, i, _, _), error in zip(downloads, errors):
+            if error is not None:
+                logger.warning(f"Error processing audio item {i}: {str(error)}")
+                paths[offset] = None
+    return {"path": paths}
+
+
 def download_audio_files(
     dataset_name: str,
-    output_dir: str,
+    output_dir: Optional[str] = None,
     split: str = "train",
     audio_column: str = "audio",
     num_samples: Optional[int] = None,
     id_column: Optional[str] = None,
+    num_proc: Optional[int] = None,
+    streaming: Optional[bool] = None,
+    dtype: str = "int16",
+    cache_dir: Optional[str] = None,
 ) -> List[str]:
     """
     Download audio files from a Hugging Face dataset and save them as WAV files.
 
+    The rows are decoded and written in batches by `num_proc` worker processes. With
+    `streaming`, the split is not materialized: rows are pulled and written one at a time
+    through `iter_audio_files`. A completed download is recorded in a manifest inside the
+    output directory, so calling this again with the same arguments returns the saved files
+    without contacting the Hub. An interrupted download is resumed by the next call with the
+    same arguments, keeping the files it had completed.
+
     Args:
         dataset_name: Name of the dataset on Hugging Face (e.g., 'OpenSpeechHubCAVA/2M-Belebele-Ja')
-        output_dir: Directory to save the downloaded audio files
+        output_dir: Directory to save the downloaded audio files. If None, uses the shared
+            cache directory given by `audio_cache_dir`.
         split: Dataset split to download (e.g., 'train', 'validation', 'test')
         audio_column: Name of the column containing audio data
         num_samples: If provided, only download this many samples (useful for testing)
         id_column: Column to use as the filename prefix. If None, will use index numbers.
+        num_proc: Number of processes writing the audio files. If None, uses the CPU count.
+        streaming: Whether to stream the rows instead of downloading the whole split.
+            If None, streams when `num_samples` is given.
+        dtype: Sample format of the WAV files, "int16" for 16-bit PCM or "float32" to keep
+            float samples
+        cache_dir: Cache directory of the datasets library. If None, uses its default
+            ($HF_DATASETS_CACHE or ~/.cache/huggingface/datasets).
 
     Returns:
         List of paths to the saved audio files
     """
-    # Simple implementation
+    _check_dtype(dtype)
+    if streaming is None:
+        streaming = num_samples is not None
+    if streaming:
+        try:
+            return list(
+                iter_audio_files(
+                    dataset_name=dataset_name,
+                    output_dir=output_dir,
+                    split=split,
+                    audio_column=audio_column,
+                    num_samples=num_samples,
+                    id_column=id_column,
+                    dtype=dtype,
+                    cache_dir=cache_dir,
+                )
+            )
+        except Exception as e:
+            print(f"Error streaming dataset {dataset_name}: {str(e)}")
+            return []
+
+    key = _download_key(
+        dataset_name, split, audio_column, num_samples, id_column, dtype
+    )
+    if output_dir is None:
+        output_dir = audio_cache_dir(
+            dataset_name, split, audio_column, num_samples, id_column, dtype
+        )
+
+    cached_files = _read_manifest(output_dir, key)
+    if cached_files is not None:
+        print(f"Using {len(cached_files)} cached audio files from {output_dir}")
+        return cached_files
 
     print(f"Loading dataset: {dataset_name}, split: {split}")
 
     try:
+        # Check the audio column from the dataset metadata before downloading any data
+        features = load_dataset_builder(dataset_name, cache_dir=cache_dir).info.features
+        if features is not None and audio_column not in features:
+            raise ValueError(
+                f"Audio column '{audio_column}' not found in dataset. "
+                f"Available columns: {list(features)}"
+            )
+
         # Load dataset
-        dataset = load_dataset(dataset_name, split=split)
+        # The Arrow files are reused from the datasets cache and memory-mapped
+        dataset = load_dataset(
+            dataset_name, split=split, cache_dir=cache_dir, keep_in_memory=False
+        )
 
         # Take a sample if requested
         if num_samples is not None and num_samples < len(dataset):
-            dataset = dataset.shuffle(seed=42).select(range(num_samples))
+            # Draw the sample's indices directly instead of shuffling every row;
+            # only the indices of the selected rows are kept in memory
+            indices = random.Random(42).sample(range(len(dataset)), num_samples)
+            dataset = dataset.select(indices, keep_in_memory=True)
             print(f"Selected {num_samples} samples from the dataset")
 
         # Ensure dataset has audio column
@@ -221,50 +735,35 @@ def download_audio_files(
 
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
+        resume = _start_manifest(output_dir, key)
+
+        # Download and save audio files, in batches spread over worker processes
+        if num_proc is None:
+            num_proc = os.cpu_count() or 1
+        written = dataset.map(
+            _write_audio_batch,
+            with_indices=True,
+            batched=True,
+            batch_size=64,
+            num_proc=max(1, min(num_proc, len(dataset))),
+            remove_columns=dataset.column_names,
+            # typed up front, as a batch of rows that all failed only holds None
+            features=Features({"path": Value("string")}),
+            fn_kwargs={
+                "audio_column": audio_column,
+                "id_column": id_column,
+                "output_dir": output_dir,
+                "decoded": _is_decoded(dataset.features[audio_column]),
+                "dtype": dtype,
+                "resume": resume,
+            },
+            # the files must be written even when the same map ran before
+            load_from_cache_file=False,
+            desc="Downloading audio files",
+        )
+        saved_files = [path for path in written["path"] if path is not None]
 
-        # Download and save audio files
-        saved_files = []
-        for i, item in enumerate(tqdm(dataset, desc="Downloading audio files")):
-            try:
-                # Get audio data
-                audio_data = item[audio_column]
-
-                # Generate file name
-                if id_column and id_column in item:
-                    # Use the provided column as file name prefix
-                    file_id = str(item[id_column])
-                    # Clean up the ID to make a valid filename
-                    file_id = "".join(c if c.isalnum() else "_" for c in file_id)
-                else:
-                    # Use index as file name
-                    file_id = f"audio_{i:05d}"
-
-                file_path = os.path.join(output_dir, f"{file_id}.wav")
-
-                # Save audio file
-                if (
-                    isinstance(audio_data, dict)
-                    and "array" in audio_data
-                    and "sampling_rate" in audio_data
-                ):
-                    # Handle array format (most common from datasets)
-                    sf.write(
-                        file_path, audio_data["array"], audio_data["sampling_rate"]
-                    )
-                    saved_files.append(file_path)
-                elif isinstance(audio_data, dict) and "path" in audio_data:
-                    # Handle path format (copy file)
-                    import shutil
-
-                    shutil.copy(audio_data["path"], file_path)
-                    saved_files.append(file_path)
-                else:
-                    print(f"Unsupported audio format for item {i}, skipping")
-
-            except Exception as e:
-                print(f"Error processing audio item {i}: {str(e)}")
-
-        # No metadata file needed
+        _write_manifest(output_dir, key, saved_files)
 
         print(f"\nDownloaded {len(saved_files)} audio files to {output_dir}")
         return saved_files
@@ -272,3 +771,143 @@ def download_audio_files(
     except Exception as e:
         print(f"Error downloading dataset {dataset_name}: {str(e)}")
         return []
+
+
+def iter_audio_files(
+    dataset_name: str,
+    output_dir: Optional[str] = None,
+    split: str = "train",
+    audio_column: str = "audio",
+    num_samples: Optional[int] = None,
+    id_column: Optional[str] = None,
+    prefetch: int = 32,
+    dtype: str = "int16",
+    cache_dir: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Stream audio files from a Hugging Face dataset, yielding each WAV file as soon as it is saved.
+
+    Rows are read with `streaming=True` and written by a background thread that stays up to
+    `prefetch` files ahead of the caller, so downloading overlaps with whatever the caller does
+    with the files. A completed run is recorded in the output directory like
+    `download_audio_files`, and later runs yield the saved files directly. An error of the
+    stream is raised once the files saved before it have been yielded, and the background
+    thread stops when the caller stops iterating.
+
+    Args:
+        dataset_name: Name of the dataset on Hugging Face (e.g., 'OpenSpeechHubCAVA/2M-Belebele-Ja')
+        output_dir: Directory to save the audio files. If None, uses a directory of the shared cache.
+        split: Dataset split to stream (e.g., 'train', 'validation', 'test')
+        audio_column: Name of the column containing audio data
+        num_samples: If provided, only stream this many samples, drawn through a shuffle buffer
+        id_column: Column to use as the filename prefix. If None, will use index numbers.
+        prefetch: Maximum number of saved files waiting to be consumed
+        dtype: Sample format of the WAV files, "int16" for 16-bit PCM or "float32" to keep
+            float samples
+        cache_dir: Cache directory of the datasets library. If None, uses its default
+            ($HF_DATASETS_CACHE or ~/.cache/huggingface/datasets).
+
+    Yields:
+        Paths to the saved audio files
+    """
+    # The shuffle buffer picks other rows than download_audio_files' full shuffle,
+    # so subsampled streams are cached separately
+    stream_split = split if num_samples is None else f"{split}:stream"
+    _check_dtype(dtype)
+    key = _download_key(
+        dataset_name, stream_split, audio_column, num_samples, id_column, dtype
+    )
+    if output_dir is None:
+        output_dir = audio_cache_dir(
+            dataset_name, stream_split, audio_column, num_samples, id_column, dtype
+        )
+
+    cached_files = _read_manifest(output_dir, key)
+    if cached_files is not None:
+        print(f"Using {len(cached_files)} cached audio files from {output_dir}")
+        yield from cached_files
+        return
+
+    print(f"Streaming dataset: {dataset_name}, split: {split}")
+    os.makedirs(output_dir, exist_ok=True)
+    resume = _start_manifest(output_dir, key)
+    file_queue = queue.Queue(maxsize=prefetch)
+    # Set when the caller stops consuming, early or on an error
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        """Queue an item for the caller, False once it has stopped consuming."""
+        while not stop.is_set():
+            try:
+                file_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            dataset = load_dataset(
+                dataset_name, split=split, streaming=True, cache_dir=cache_dir
+            )
+            if num_samples is not None:
+                dataset = dataset.shuffle(seed=42).take(num_samples)
+            features = dataset.features
+            feature = features.get(audio_column) if features is not None else None
+            if not isinstance(feature, Audio):
+                dataset = dataset.cast_column(audio_column, Audio())
+                feature = Audio()
+            save_audio = _save_decoded_audio if _is_decoded(feature) else _save_audio
+
+            prefix = os.path.join(output_dir, "")
+            saved_files = []
+            progress = tqdm(
+                dataset,
+                desc="Downloading audio files",
+                total=num_samples,
+                # refresh about 100 times over a known number of rows
+                miniters=max(1, (num_samples or 0) // 100),
+                mininterval=0.5,
+            )
+            for i, item in enumerate(progress):
+                if stop.is_set():
+                    return
+                if audio_column not in item:
+                    raise ValueError(
+                        f"Audio column '{audio_column}' not found in dataset. "
+                        f"Available columns: {list(item.keys())}"
+                    )
+                try:
+                    file_path = f"{prefix}{_audio_file_id(item, i, id_column)}.wav"
+                    if (resume and os.path.isfile(file_path)) or save_audio(
+                        item[audio_column], file_path, dtype
+                    ):
+                        saved_files.append(file_path)
+                        if not put(file_path):
+                            return
+                    else:
+                        logger.warning(
+                            f"Unsupported audio format for item {i}, skipping"
+                        )
+                except Exception as e:
+                    logger.warning(f"Error processing audio item {i}: {str(e)}")
+
+            _write_manifest(output_dir, key, saved_files)
+            put(done)
+        except Exception as e:
+            put(e)
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    try:
+        while True:
+            file_path = file_queue.get()
+            if file_path is done:
+                return
+            if isinstance(file_path, Exception):
+                # Raised here, so that a failed stream is not taken for a complete one
+                raise file_path
+            yield file_path
+    finally:
+        stop.set()